@@ -0,0 +1,71 @@
+"""
+Micro-benchmark of the :py:mod:`ytmusicapi.json_backend` backends on recorded responses.
+
+Each installed backend decodes the raw bytes of every response and encodes the decoded result again,
+as :py:meth:`YTMusicBase._send_request` and the API do. The previous decoding of the response text
+with the standard library is timed for comparison::
+
+    python benchmarks/json_backend.py response.json [response.json ...]
+    python benchmarks/json_backend.py --record VLPLxxxx playlist.json
+
+``--record`` saves the raw response of a browse request, e.g. a playlist or an album.
+The garbage collector stays enabled, as it is while serving requests.
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ytmusicapi import json_backend  # noqa: E402
+
+
+def record(browse_id: str, path: str) -> None:
+    from ytmusicapi import YTMusic
+
+    response = YTMusic()._send_request("browse", {"browseId": browse_id})
+    Path(path).write_bytes(json_backend.dumps(response))
+
+
+def best(statement: object, number: int, repeat: int) -> float:
+    """:return: the fastest run in ms per call"""
+    return min(timeit.repeat(statement, number=number, repeat=repeat)) / number * 1e3  # type: ignore[arg-type]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("responses", nargs="*", help="recorded responses as JSON files")
+    parser.add_argument("--record", nargs=2, metavar=("BROWSE_ID", "FILE"), help="record a browse response first")
+    parser.add_argument("--number", type=int, default=10, help="calls per run")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    if args.record:
+        record(*args.record)
+        args.responses.append(args.record[1])
+    if not args.responses:
+        parser.error("no responses given")
+
+    selected = json_backend.backend
+    for file in args.responses:
+        raw = Path(file).read_bytes()
+        print(f"{file}: {len(raw) / 2**20:.1f} MiB")
+        text = best(lambda: json.loads(raw.decode("utf-8")), args.number, args.repeat)
+        print(f"  json.loads(text) decode {text:.1f} ms")
+        for name in json_backend.BACKENDS:
+            try:
+                json_backend.set_backend(name)
+            except ImportError:
+                print(f"  {name}: not installed")
+                continue
+            document = json_backend.loads(raw)
+            decode = best(lambda: json_backend.loads(raw), args.number, args.repeat)
+            encode = best(lambda: json_backend.dumps(document), args.number, args.repeat)
+            print(f"  {name}: decode {decode:.1f} ms ({text / decode:.1f}x), encode {encode:.1f} ms")
+    json_backend.set_backend(selected)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Micro-benchmark of :py:func:`ytmusicapi.navigation.nav` with compiled NavPath constants
+against the previous implementation, which walked a list of keys.
+
+Every navigation constant is looked up from every object of the given recorded responses
+it resolves on, so the mix of paths follows the responses::
+
+    python benchmarks/navigation.py response.json [response.json ...]
+    python benchmarks/navigation.py --record VLPLxxxx playlist.json
+
+``--record`` saves the raw response of a browse request, e.g. a playlist or an album.
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ytmusicapi import navigation  # noqa: E402
+from ytmusicapi.navigation import NavPath, nav  # noqa: E402
+
+
+def nav_list(root: Any, items: list[Any], none_if_absent: bool = False) -> Any:
+    """nav before NavPath, kept for comparison"""
+    if root is None:
+        return None
+    try:
+        for k in items:
+            root = root[k]
+    except (KeyError, IndexError) as e:
+        if none_if_absent:
+            return None
+        raise type(e)(f"Unable to find '{k}' using path {items!r} on {root!r}, exception: {e}")
+    return root
+
+
+def objects(root: Any) -> list[Any]:
+    found, stack = [], [root]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            found.append(value)
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return found
+
+
+def resolves(obj: Any, path: NavPath) -> bool:
+    try:
+        return nav(obj, path, True) is not None
+    except TypeError:
+        return False
+
+
+def lookups(response: Any) -> list[tuple[Any, NavPath]]:
+    paths = [value for value in vars(navigation).values() if isinstance(value, NavPath) and value]
+    return [(obj, path) for obj in objects(response) for path in paths if resolves(obj, path)]
+
+
+def record(browse_id: str, path: str) -> None:
+    from ytmusicapi import YTMusic
+
+    response = YTMusic()._send_request("browse", {"browseId": browse_id})
+    Path(path).write_text(json.dumps(response), encoding="utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("responses", nargs="*", help="recorded responses as JSON files")
+    parser.add_argument("--record", nargs=2, metavar=("BROWSE_ID", "FILE"), help="record a browse response first")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    if args.record:
+        record(*args.record)
+        args.responses.append(args.record[1])
+    if not args.responses:
+        parser.error("no responses given")
+
+    for file in args.responses:
+        pairs = lookups(json.loads(Path(file).read_text(encoding="utf-8")))
+        listed = [(obj, list(path)) for obj, path in pairs]
+        number = max(1, 200_000 // max(1, len(pairs)))
+        compiled = min(
+            timeit.repeat(lambda: [nav(obj, path) for obj, path in pairs], number=number, repeat=args.repeat)
+        )
+        walked = min(
+            timeit.repeat(lambda: [nav_list(obj, path) for obj, path in listed], number=number, repeat=args.repeat)
+        )
+        per_lookup = 1e9 / (number * len(pairs))
+        print(
+            f"{file}: {len(pairs)} lookups, list {walked * per_lookup:.0f} ns, NavPath {compiled * per_lookup:.0f} ns"
+            f" per lookup ({walked / compiled:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
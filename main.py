@@ -1,16 +1,68 @@
-from fastapi import FastAPI, Query, HTTPException, Request
+from fastapi import FastAPI, Query, HTTPException, Request, Body
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, RedirectResponse
+from fastapi.responses import StreamingResponse, RedirectResponse, JSONResponse
+from starlette.background import BackgroundTask
 from ytmusicapi.ytmusic import YTMusic
+from ytmusicapi.async_ytmusic import AsyncYTMusic
+from ytmusicapi.cache import MemoryCache, SQLiteCache, TieredCache
+from ytmusicapi.models import Thumbnail, Track
+from ytmusicapi import json_backend
+from ytmusicapi.singleflight import AsyncSingleFlight
+from ytmusicapi.constants import SUPPORTED_LOCATIONS
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import asynccontextmanager
+from dataclasses import asdict
 import boto3
 from botocore.config import Config
+from botocore.exceptions import ClientError
 import httpx
 import time
 import os
 import asyncio
+import csv
+import hashlib
+import importlib.util
+import ipaddress
+import itertools
+import math
+import mmap
+import re
+import struct
+import tempfile
 
-app = FastAPI(title="YTMusic API", docs_url="/docs")
+try:
+    import maxminddb
+except ImportError:
+    # only needed for MaxMind .mmdb databases
+    maxminddb = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    open_http_clients()
+    await load_country_resolver()
+    # until the first listing completes, unknown ids are checked with a HEAD request
+    app.state.r2_index_refresher = asyncio.create_task(keep_r2_index_fresh())
+    app.state.stream_url_sweeper = asyncio.create_task(sweep_stream_urls())
+    app.state.explore_refresher = asyncio.create_task(keep_explore_fresh())
+    app.state.prefetch_workers = [asyncio.create_task(prefetch_worker()) for _ in range(PREFETCH_CONCURRENCY)]
+    try:
+        yield
+    finally:
+        app.state.r2_index_refresher.cancel()
+        app.state.stream_url_sweeper.cancel()
+        app.state.explore_refresher.cancel()
+        for worker in app.state.prefetch_workers:
+            worker.cancel()
+        await close_http_clients()
+        await ayt.aclose()
+
+class BackendJSONResponse(JSONResponse):
+    """Encodes with the same JSON backend that decodes the YouTube Music responses"""
+
+    def render(self, content) -> bytes:
+        return json_backend.dumps(content)
+
+app = FastAPI(title="YTMusic API", docs_url="/docs", lifespan=lifespan, default_response_class=BackendJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -20,7 +72,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-yt = YTMusic()
+YTM_CACHE_DB = os.getenv("YTM_CACHE_DB")
+cache_tiers = [MemoryCache(maxsize=4096)]
+if YTM_CACHE_DB:
+    cache_tiers.append(SQLiteCache(YTM_CACHE_DB))
+response_cache = TieredCache(*cache_tiers)
+
+yt = YTMusic(cache=response_cache)
+ayt = AsyncYTMusic(cache=response_cache)
 executor = ThreadPoolExecutor(max_workers=100)
 
 R2_ACCOUNT_ID = os.getenv("R2_ACCOUNT_ID", "cfc842a40b4ee9ef4d556523e51da3d8")
@@ -38,6 +97,36 @@ s3 = boto3.client(
     region_name="auto"
 )
 
+# HTTP/2 lets the requests to one host share a single connection, it needs the h2 package
+HTTP2 = importlib.util.find_spec("h2") is not None
+# outbound clients by service, kept open for the lifetime of the app so that connections
+# and TLS sessions are reused. The limits apply per client, every service mostly talks to a few hosts
+HTTP_CLIENTS = {
+    "piped": {
+        "timeout": 15,
+        "limits": httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60),
+    },
+    # long-lived audio downloads from the googlevideo hosts returned by Piped
+    "audio": {
+        "timeout": httpx.Timeout(300, connect=10),
+        "limits": httpx.Limits(max_connections=500, max_keepalive_connections=50, keepalive_expiry=30),
+    },
+    "geo": {
+        "timeout": 5,
+        "limits": httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60),
+    },
+}
+http_clients = {}
+
+def open_http_clients():
+    for name, settings in HTTP_CLIENTS.items():
+        http_clients[name] = httpx.AsyncClient(http2=HTTP2, **settings)
+
+async def close_http_clients():
+    clients = list(http_clients.values())
+    http_clients.clear()
+    await asyncio.gather(*(client.aclose() for client in clients))
+
 PIPED_INSTANCES = [
     "https://pipedapi.kavin.rocks",
     "https://pipedapi.adminforge.de",
@@ -46,81 +135,522 @@ PIPED_INSTANCES = [
     "https://pipedapi.colinslegacy.com",
 ]
 
-stream_url_cache = {}
-cache_expiry = {}
+# instances queried at the same time per lookup, the first usable answer wins
+PIPED_HEDGE = int(os.getenv("PIPED_HEDGE", "2"))
+# weight of the latest request in the smoothed latency and error rate
+PIPED_EWMA_ALPHA = 0.3
+# consecutive failures that take an instance out of rotation, for a cooldown doubling with every further failure
+PIPED_FAILURE_THRESHOLD = 3
+PIPED_COOLDOWN = 30
+PIPED_MAX_COOLDOWN = 600
 
-def check_r2_exists(video_id: str) -> bool:
-    try:
-        s3.head_object(Bucket=R2_BUCKET, Key=f"audio/{video_id}.webm")
+class InstanceHealth:
+    """Smoothed latency and error rate of a Piped instance, with a circuit breaker for persistent failures"""
+
+    def __init__(self):
+        self.latency = 1.0
+        self.error_rate = 0.0
+        self.failures = 0
+        self.open_until = 0.0
+
+    @property
+    def score(self) -> float:
+        # expected seconds until a usable answer, an instance failing half of the time counts three times as slow
+        return self.latency * (1 + 4 * self.error_rate)
+
+    def available(self, now: float) -> bool:
+        return self.open_until <= now
+
+    def start(self):
+        if self.failures >= PIPED_FAILURE_THRESHOLD:
+            # half open: this request probes the instance, the others keep skipping it meanwhile
+            self.open_until = time.time() + HTTP_CLIENTS["piped"]["timeout"]
+
+    def record_success(self, latency: float):
+        self.latency += PIPED_EWMA_ALPHA * (latency - self.latency)
+        self.error_rate -= PIPED_EWMA_ALPHA * self.error_rate
+        self.failures = 0
+        self.open_until = 0.0
+
+    def record_abandoned(self, elapsed: float):
+        if elapsed > self.latency:
+            self.latency += PIPED_EWMA_ALPHA * (elapsed - self.latency)
+        if self.failures >= PIPED_FAILURE_THRESHOLD:
+            # the probe was inconclusive, allow the next one
+            self.open_until = 0.0
+
+    def record_failure(self, latency: float):
+        self.latency += PIPED_EWMA_ALPHA * (latency - self.latency)
+        self.error_rate += PIPED_EWMA_ALPHA * (1 - self.error_rate)
+        self.failures += 1
+        if self.failures >= PIPED_FAILURE_THRESHOLD:
+            cooldown = PIPED_COOLDOWN * 2 ** (self.failures - PIPED_FAILURE_THRESHOLD)
+            self.open_until = time.time() + min(cooldown, PIPED_MAX_COOLDOWN)
+
+piped_health = {instance: InstanceHealth() for instance in PIPED_INSTANCES}
+
+def ranked_piped_instances() -> list:
+    now = time.time()
+    ranked = [i for i in sorted(PIPED_INSTANCES, key=lambda i: piped_health[i].score) if piped_health[i].available(now)]
+    # with every circuit open, the instance that would reopen first is still tried rather than failing outright
+    return ranked or [min(PIPED_INSTANCES, key=lambda i: piped_health[i].open_until)]
+
+# resolved Piped audio urls as JSON, the least recently played tracks are evicted first
+stream_urls = MemoryCache(
+    maxsize=int(os.getenv("STREAM_URL_CACHE_SIZE", "20000")),
+    maxbytes=int(os.getenv("STREAM_URL_CACHE_BYTES", str(32 * 1024 * 1024)))
+)
+STREAM_URL_TTL = 14400
+STREAM_URL_SWEEP_INTERVAL = 60
+piped_lookups = AsyncSingleFlight()
+
+async def sweep_stream_urls():
+    while True:
+        await asyncio.sleep(STREAM_URL_SWEEP_INTERVAL)
+        stream_urls.purge_expired()
+
+class BloomFilter:
+    """Set membership in a fixed bit array, with false positives at the configured rate but never false negatives"""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1, h2 = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little")
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+# video ids known to be in R2, with the time they were added
+r2_index = {}
+# video ids a HEAD request found missing. A false positive only means a track
+# uploaded by another instance is streamed from upstream until the next refresh
+r2_missing = BloomFilter(capacity=1_000_000)
+# whether r2_index holds a complete listing. Ids uploaded by other instances since are missing from it
+r2_index_complete = False
+R2_INDEX_REFRESH = int(os.getenv("R2_INDEX_REFRESH", "900"))
+
+def list_r2_audio_ids() -> set:
+    ids = set()
+    for page in s3.get_paginator("list_objects_v2").paginate(Bucket=R2_BUCKET, Prefix="audio/"):
+        for obj in page.get("Contents", []):
+            key = obj["Key"]
+            if key.endswith(".webm"):
+                ids.add(key[len("audio/"):-len(".webm")])
+    return ids
+
+async def refresh_r2_index():
+    global r2_index, r2_missing, r2_index_complete
+    started = time.time()
+    listed = await asyncio.to_thread(list_r2_audio_ids)
+    # uploads that finished while listing may be missing from it
+    recent = {video_id: added for video_id, added in r2_index.items() if added >= started}
+    r2_index = {**dict.fromkeys(listed, started), **recent}
+    r2_missing = BloomFilter(capacity=1_000_000)
+    r2_index_complete = True
+    prune_r2_urls()
+
+async def keep_r2_index_fresh():
+    while True:
+        try:
+            await refresh_r2_index()
+        except Exception as e:
+            print(f"R2 index refresh error: {e}")
+        await asyncio.sleep(R2_INDEX_REFRESH)
+
+def mark_in_r2(video_id: str):
+    r2_index[video_id] = time.time()
+
+async def check_r2_exists(video_id: str) -> bool:
+    if video_id in r2_index:
         return True
-    except:
+    if video_id in r2_missing:
+        return False
+    try:
+        await asyncio.to_thread(s3.head_object, Bucket=R2_BUCKET, Key=f"audio/{video_id}.webm")
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            r2_missing.add(video_id)
+        else:
+            print(f"R2 head error: {e}")
+        return False
+    except Exception as e:
+        print(f"R2 head error: {e}")
         return False
+    mark_in_r2(video_id)
+    return True
 
-def get_r2_url(video_id: str) -> str:
+R2_URL_TTL = int(os.getenv("R2_URL_TTL", "86400"))
+# a cached signature is renewed once it has less than this left, so that no client gets an expiring url
+R2_URL_MARGIN = int(os.getenv("R2_URL_MARGIN", "3600"))
+# video id -> (presigned url, expiry timestamp)
+r2_urls = {}
+
+def get_r2_url(video_id: str) -> tuple[str, int] | tuple[None, None]:
+    """:return: presigned url and the seconds it stays in use, the same url is handed out until then"""
+    now = time.time()
+    cached = r2_urls.get(video_id)
+    if cached and cached[1] - R2_URL_MARGIN > now:
+        return cached[0], int(cached[1] - R2_URL_MARGIN - now)
     try:
-        return s3.generate_presigned_url(
+        url = s3.generate_presigned_url(
             "get_object",
             Params={"Bucket": R2_BUCKET, "Key": f"audio/{video_id}.webm"},
-            ExpiresIn=86400
+            ExpiresIn=R2_URL_TTL
         )
-    except:
-        return None
+    except Exception as e:
+        print(f"R2 presign error: {e}")
+        return None, None
+    r2_urls[video_id] = (url, now + R2_URL_TTL)
+    return url, max(0, R2_URL_TTL - R2_URL_MARGIN)
+
+def prune_r2_urls():
+    now = time.time()
+    for video_id, (_, expires) in list(r2_urls.items()):
+        if expires - R2_URL_MARGIN <= now:
+            del r2_urls[video_id]
+
+# S3 requires at least 5 MiB for every part but the last
+R2_PART_SIZE = 5 * 1024 * 1024
+# parts uploaded at the same time per track, peak memory is about (this + 1) * R2_PART_SIZE
+R2_UPLOAD_CONCURRENCY = 2
+R2_PART_ATTEMPTS = 3
 
-async def upload_to_r2(video_id: str, audio_data: bytes):
+async def upload_part_to_r2(key: str, upload_id: str, part_number: int, data: bytes, slots: asyncio.Semaphore) -> dict:
     try:
-        s3.put_object(
+        for attempt in range(R2_PART_ATTEMPTS):
+            try:
+                # boto3 blocks, every call runs on a worker thread
+                upload = asyncio.ensure_future(asyncio.to_thread(
+                    s3.upload_part,
+                    Bucket=R2_BUCKET,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=data
+                ))
+                try:
+                    part = await asyncio.shield(upload)
+                except asyncio.CancelledError:
+                    # the thread cannot be interrupted, cancelling only returns once the part is settled
+                    await asyncio.gather(upload, return_exceptions=True)
+                    raise
+                return {"PartNumber": part_number, "ETag": part["ETag"]}
+            except Exception:
+                if attempt == R2_PART_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(2 ** attempt)
+    finally:
+        slots.release()
+
+async def upload_to_r2(video_id: str, chunks) -> bool:
+    """Uploads an async iterator of chunks in parts, holding at most a few parts in memory"""
+    key = f"audio/{video_id}.webm"
+    slots = asyncio.Semaphore(R2_UPLOAD_CONCURRENCY)
+    buffer = bytearray()
+    upload_id = None
+    parts = []
+    try:
+        async for chunk in chunks:
+            buffer += chunk
+            if len(buffer) < R2_PART_SIZE:
+                continue
+            if upload_id is None:
+                created = await asyncio.to_thread(
+                    s3.create_multipart_upload, Bucket=R2_BUCKET, Key=key, ContentType="audio/webm"
+                )
+                upload_id = created["UploadId"]
+            await slots.acquire()
+            parts.append(asyncio.create_task(
+                upload_part_to_r2(key, upload_id, len(parts) + 1, bytes(buffer), slots)
+            ))
+            buffer.clear()
+        
+        if upload_id is None:
+            # shorter than a single part
+            await asyncio.to_thread(
+                s3.put_object, Bucket=R2_BUCKET, Key=key, Body=bytes(buffer), ContentType="audio/webm"
+            )
+            mark_in_r2(video_id)
+            return True
+        if buffer:
+            await slots.acquire()
+            parts.append(asyncio.create_task(
+                upload_part_to_r2(key, upload_id, len(parts) + 1, bytes(buffer), slots)
+            ))
+        completed = await asyncio.gather(*parts)
+        await asyncio.to_thread(
+            s3.complete_multipart_upload,
             Bucket=R2_BUCKET,
-            Key=f"audio/{video_id}.webm",
-            Body=audio_data,
-            ContentType="audio/webm"
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": completed}
         )
+        mark_in_r2(video_id)
         return True
-    except Exception as e:
+    except BaseException as e:
+        for part in parts:
+            part.cancel()
+        # parts that finished after the abort would be stored, and billed, without ever being completed
+        await asyncio.gather(*parts, return_exceptions=True)
+        if upload_id is not None:
+            try:
+                await asyncio.to_thread(s3.abort_multipart_upload, Bucket=R2_BUCKET, Key=key, UploadId=upload_id)
+            except Exception as abort_error:
+                print(f"R2 abort error: {abort_error}")
+        if not isinstance(e, Exception):
+            raise
         print(f"R2 upload error: {e}")
         return False
 
 async def get_audio_url_from_piped(video_id: str) -> dict:
-    if video_id in stream_url_cache and cache_expiry.get(video_id, 0) > time.time():
-        return stream_url_cache[video_id]
-    
-    async with httpx.AsyncClient(timeout=15) as client:
-        for instance in PIPED_INSTANCES:
-            try:
-                resp = await client.get(f"{instance}/streams/{video_id}")
-                if resp.status_code == 200:
-                    data = resp.json()
-                    audio_streams = data.get("audioStreams", [])
-                    if audio_streams:
-                        best = max(audio_streams, key=lambda x: x.get("bitrate", 0))
-                        result = {
-                            "url": best.get("url"),
-                            "bitrate": best.get("bitrate"),
-                            "format": best.get("format", "webm"),
-                            "codec": best.get("codec", "opus")
-                        }
-                        stream_url_cache[video_id] = result
-                        cache_expiry[video_id] = time.time() + 14400
-                        return result
-            except:
-                continue
+    cached = stream_urls.get(video_id)
+    if cached is not None:
+        return json_backend.loads(cached)
+    # concurrent misses for the same video share one walk over the instances
+    return await piped_lookups.do(video_id, lambda: fetch_audio_url_from_piped(video_id))
+
+def best_audio_stream(data: dict) -> dict:
+    audio_streams = data.get("audioStreams", [])
+    if not audio_streams:
+        return None
+    best = max(audio_streams, key=lambda x: x.get("bitrate", 0))
+    return {
+        "url": best.get("url"),
+        "bitrate": best.get("bitrate"),
+        "format": best.get("format", "webm"),
+        "codec": best.get("codec", "opus")
+    }
+
+def piped_error_body(resp: httpx.Response) -> bool:
+    """True if piped answered with its own error, e.g. for an unavailable video"""
+    try:
+        body = resp.json()
+    except ValueError:
+        return False
+    return isinstance(body, dict) and "error" in body
+
+async def query_piped_instance(client: httpx.AsyncClient, instance: str, video_id: str) -> dict:
+    health = piped_health[instance]
+    health.start()
+    started = time.monotonic()
+    try:
+        resp = await client.get(f"{instance}/streams/{video_id}")
+        # only an instance that cannot answer at all is failing, errors about the video are a valid answer
+        if resp.status_code >= 500 and not piped_error_body(resp):
+            raise httpx.HTTPStatusError(f"{resp.status_code}", request=resp.request, response=resp)
+        data = resp.json() if resp.status_code == 200 else None
+    except asyncio.CancelledError:
+        # lost the race, it took at least this long
+        health.record_abandoned(time.monotonic() - started)
+        raise
+    except Exception:
+        health.record_failure(time.monotonic() - started)
+        return None
+    health.record_success(time.monotonic() - started)
+    # a missing video or a track without audio streams is not held against the instance
+    return best_audio_stream(data) if data is not None else None
+
+async def fetch_audio_url_from_piped(video_id: str) -> dict:
+    """Races the healthiest instances, each failure starts the next one in line"""
+    candidates = iter(ranked_piped_instances())
+    pending = set()
+    client = http_clients["piped"]
+
+    def start_next():
+        instance = next(candidates, None)
+        if instance is not None:
+            pending.add(asyncio.create_task(query_piped_instance(client, instance, video_id)))
+
+    for _ in range(PIPED_HEDGE):
+        start_next()
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            pending.difference_update(done)
+            for task in done:
+                result = task.result()
+                if result:
+                    stream_urls.set(video_id, json_backend.dumps(result), STREAM_URL_TTL)
+                    return result
+                start_next()
+    finally:
+        # the slower requests are abandoned, they are not counted as failures
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
     return None
 
-async def download_and_cache(video_id: str, audio_url: str) -> bool:
+# tracks whose stream is currently being copied into R2
+cache_fills = set()
+# uploads fed by client streams, referenced until they finish
+r2_uploads = set()
+# chunks waiting for the uploader, the client stream is slowed down if it falls behind further
+TEE_QUEUE_CHUNKS = 32
+
+async def drain_queue(queue: asyncio.Queue):
+    while (chunk := await queue.get()) is not None:
+        yield chunk
+
+async def fill_r2_from_queue(video_id: str, queue: asyncio.Queue):
     try:
-        async with httpx.AsyncClient(timeout=300) as client:
-            resp = await client.get(audio_url)
-            if resp.status_code == 200:
-                await upload_to_r2(video_id, resp.content)
-                return True
-    except Exception as e:
-        print(f"Download error: {e}")
-    return False
+        if not await upload_to_r2(video_id, drain_queue(queue)):
+            # keep consuming, so that a failed upload never blocks the stream to the client
+            while await queue.get() is not None:
+                pass
+    finally:
+        cache_fills.discard(video_id)
+
+async def tee_to_r2(video_id: str, chunks, expected_length: int | None):
+    """Passes the chunks through while uploading them to R2, the upload is aborted if the stream is incomplete"""
+    cache_fills.add(video_id)
+    queue = asyncio.Queue(maxsize=TEE_QUEUE_CHUNKS)
+    upload = asyncio.create_task(fill_r2_from_queue(video_id, queue))
+    r2_uploads.add(upload)
+    upload.add_done_callback(r2_uploads.discard)
+    size = 0
+    complete = False
+    try:
+        async for chunk in chunks:
+            await queue.put(chunk)
+            size += len(chunk)
+            yield chunk
+        if expected_length is None or size == expected_length:
+            await queue.put(None)
+            complete = True
+    finally:
+        # an aborted stream is dropped, the next full request fills the cache instead
+        if not complete:
+            upload.cancel()
+
+def is_complete_body(resp: httpx.Response) -> bool:
+    if resp.status_code == 200:
+        return True
+    # a 206 for bytes=0- may still cover the whole file
+    content_range = resp.headers.get("content-range", "")
+    match = re.fullmatch(r"bytes 0-(\d+)/(\d+)", content_range.strip())
+    return resp.status_code == 206 and match is not None and int(match[1]) + 1 == int(match[2])
+
+class TokenBucket:
+    """Refills at rate units per second up to capacity. Charges may overdraw it, wait() holds callers until it recovers"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def charge(self, amount: float):
+        self._refill()
+        self.tokens -= amount
+
+    async def wait(self):
+        self._refill()
+        while self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
+            self._refill()
+
+# background downloads of tracks likely to be played soon, 0 disables prefetching
+PREFETCH_CONCURRENCY = int(os.getenv("PREFETCH_CONCURRENCY", "2"))
+PREFETCH_QUEUE_SIZE = 1000
+# lower is fetched first: the upcoming tracks of a radio someone is listening to, then the charts
+PREFETCH_PRIORITY_RADIO = 0
+PREFETCH_PRIORITY_CHARTS = 1
+PREFETCH_RADIO_TRACKS = 5
+PREFETCH_CHART_TRACKS = 10
+# leaves the bandwidth to the streams of actual listeners, and caps the upstream and R2 traffic per hour
+PREFETCH_BYTES_PER_SECOND = int(os.getenv("PREFETCH_BYTES_PER_SECOND", str(2 * 1024 * 1024)))
+PREFETCH_BYTES_PER_HOUR = int(os.getenv("PREFETCH_BYTES_PER_HOUR", str(2 * 1024 ** 3)))
+prefetch_bandwidth = TokenBucket(rate=PREFETCH_BYTES_PER_SECOND, capacity=1024 * 1024)
+prefetch_hourly = TokenBucket(rate=PREFETCH_BYTES_PER_HOUR / 3600, capacity=PREFETCH_BYTES_PER_HOUR)
+# (priority, position, sequence, video id)
+prefetch_queue = asyncio.PriorityQueue(maxsize=PREFETCH_QUEUE_SIZE)
+prefetch_pending = set()
+prefetch_sequence = itertools.count()
+prefetch_stats = {"scheduled": 0, "dropped": 0, "filled": 0, "failed": 0, "bytes": 0}
+
+def schedule_prefetch(video_ids, priority: int):
+    if PREFETCH_CONCURRENCY <= 0:
+        return
+    for position, video_id in enumerate(video_ids):
+        if not video_id or video_id in prefetch_pending or video_id in r2_index or video_id in cache_fills:
+            continue
+        try:
+            prefetch_queue.put_nowait((priority, position, next(prefetch_sequence), video_id))
+        except asyncio.QueueFull:
+            prefetch_stats["dropped"] += 1
+            continue
+        prefetch_pending.add(video_id)
+        prefetch_stats["scheduled"] += 1
+
+async def metered_chunks(resp: httpx.Response, expected_length: int | None):
+    size = 0
+    async for chunk in resp.aiter_raw(chunk_size=65536):
+        await prefetch_bandwidth.wait()
+        prefetch_bandwidth.charge(len(chunk))
+        prefetch_hourly.charge(len(chunk))
+        prefetch_stats["bytes"] += len(chunk)
+        size += len(chunk)
+        yield chunk
+    if expected_length is not None and size != expected_length:
+        # aborts the upload
+        raise httpx.ReadError(f"download ended after {size} of {expected_length} bytes")
+
+async def prefetch_audio(video_id: str) -> bool:
+    if video_id in cache_fills or await check_r2_exists(video_id):
+        return False
+    audio_info = await get_audio_url_from_piped(video_id)
+    if not audio_info:
+        return False
+    # a listener requesting the track meanwhile is streamed from upstream without a second fill
+    cache_fills.add(video_id)
+    try:
+        async with http_clients["audio"].stream("GET", audio_info["url"]) as resp:
+            if resp.status_code != 200:
+                raise httpx.HTTPStatusError(f"{resp.status_code}", request=resp.request, response=resp)
+            content_length = resp.headers.get("content-length")
+            if not await upload_to_r2(video_id, metered_chunks(resp, int(content_length) if content_length else None)):
+                # the upload was aborted after an error, unlike the skips above this is a failed prefetch
+                prefetch_stats["failed"] += 1
+                return False
+            return True
+    finally:
+        cache_fills.discard(video_id)
+
+async def prefetch_worker():
+    while True:
+        *_, video_id = await prefetch_queue.get()
+        try:
+            # the hourly budget is checked before each download, which may then overdraw it
+            await prefetch_hourly.wait()
+            if await prefetch_audio(video_id):
+                prefetch_stats["filled"] += 1
+        except Exception as e:
+            prefetch_stats["failed"] += 1
+            print(f"Prefetch error for {video_id}: {e}")
+        finally:
+            prefetch_pending.discard(video_id)
 
 def get_best_thumbnail(thumbnails: list) -> str:
     if not thumbnails:
         return None
-    best = max(thumbnails, key=lambda x: x.get("width", 0) * x.get("height", 0))
-    url = best.get("url", "")
+    if isinstance(thumbnails[0], Thumbnail):
+        url = max(thumbnails, key=lambda x: x.width * x.height).url
+    else:
+        url = max(thumbnails, key=lambda x: x.get("width", 0) * x.get("height", 0)).get("url", "")
     if "ytimg.com" in url:
         if "/vi/" in url:
             vid_id = url.split("/vi/")[1].split("/")[0]
@@ -136,7 +666,18 @@ def get_best_thumbnail(thumbnails: list) -> str:
         return url.split("=")[0] + "=s800-c-k-c0x00ffffff-no-rj"
     return url
 
-def format_track(track: dict) -> dict:
+def format_track(track: dict | Track) -> dict:
+    if isinstance(track, Track):
+        return {
+            "id": track.videoId,
+            "title": track.title,
+            "artist": ", ".join(a.name for a in track.artists) if track.artists else "",
+            "album": track.album.name if track.album else None,
+            "duration": track.duration,
+            "duration_seconds": track.duration_seconds,
+            "cover": get_best_thumbnail(track.thumbnails),
+            "isExplicit": track.isExplicit
+        }
     thumbnails = track.get("thumbnails", [])
     album = track.get("album", {})
     return {
@@ -150,137 +691,433 @@ def format_track(track: dict) -> dict:
         "isExplicit": track.get("isExplicit", False)
     }
 
-async def get_country_from_ip(request) -> str:
+DEFAULT_COUNTRY = "US"
+# MaxMind .mmdb file or CSV of ip ranges, ip-api.com is asked instead if unset
+GEOIP_DB = os.getenv("GEOIP_DB")
+# clients in the same /24 (/48 for IPv6) are assumed to be in the same country
+geo_cache = MemoryCache(maxsize=100_000, maxbytes=16 * 1024 * 1024)
+GEO_CACHE_TTL = 86400
+# ip address -> country code or None, set from GEOIP_DB on startup
+country_resolver = None
+
+def ipv6_bytes(address) -> bytes:
+    """IPv4 addresses are mapped into the IPv6 space, so that both sort in a single index"""
+    if address.version == 4:
+        return b"\0" * 10 + b"\xff\xff" + address.packed
+    return address.packed
+
+class RangeCountryIndex:
+    """
+    Country lookups in a CSV of ip ranges (first ip, last ip, country code, ...) as published by DB-IP or IP2Location.
+    The CSV is compiled once into a file of sorted fixed-width records next to it, which is memory-mapped
+    and binary searched, so the database is neither parsed nor held in memory by every worker
+    """
+
+    RECORD = struct.Struct(">16s16s2s")
+
+    def __init__(self, csv_path: str):
+        index_path = csv_path + ".idx"
+        if not os.path.exists(index_path) or os.path.getmtime(index_path) < os.path.getmtime(csv_path):
+            self.compile(csv_path, index_path)
+        with open(index_path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.path.getsize(index_path) else b""
+        self.count = len(self.data) // self.RECORD.size
+
+    @staticmethod
+    def parse_address(value: str) -> bytes:
+        value = value.strip()
+        # IP2Location stores addresses as integers
+        return ipv6_bytes(ipaddress.ip_address(int(value) if value.isdigit() else value))
+
+    @classmethod
+    def compile(cls, csv_path: str, index_path: str):
+        records = []
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            for row in csv.reader(f):
+                try:
+                    first, last = cls.parse_address(row[0]), cls.parse_address(row[1])
+                    country = row[2].strip().upper()
+                except (IndexError, ValueError):
+                    # header or comment
+                    continue
+                if len(country) == 2 and country.isascii() and country.isalpha():
+                    records.append(cls.RECORD.pack(first, last, country.encode()))
+        records.sort()
+        # a temporary file per process, workers compiling at the same time each publish a complete index
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(index_path) or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.writelines(records)
+            os.replace(tmp_path, index_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def __call__(self, address) -> str | None:
+        key = ipv6_bytes(address)
+        size = self.RECORD.size
+        # find the last range starting at or before the address
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.data[mid * size:mid * size + 16] <= key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == 0:
+            return None
+        _, last, country = self.RECORD.unpack_from(self.data, (lo - 1) * size)
+        return country.decode() if key <= last else None
+
+def open_mmdb(path: str):
+    if maxminddb is None:
+        raise RuntimeError("reading .mmdb databases requires the maxminddb package")
+    reader = maxminddb.open_database(path, maxminddb.MODE_MMAP)
+
+    def lookup(address) -> str | None:
+        record = reader.get(str(address)) or {}
+        return (record.get("country") or record.get("registered_country") or {}).get("iso_code")
+
+    return lookup
+
+async def load_country_resolver():
+    global country_resolver
+    if not GEOIP_DB:
+        return
     try:
-        forwarded = request.headers.get("x-forwarded-for", "").split(",")[0].strip()
-        client_ip = forwarded or request.client.host
-        async with httpx.AsyncClient(timeout=5) as client:
-            resp = await client.get(f"http://ip-api.com/json/{client_ip}?fields=countryCode")
-            if resp.status_code == 200:
-                return resp.json().get("countryCode", "US")
-    except:
+        opener = open_mmdb if GEOIP_DB.endswith(".mmdb") else RangeCountryIndex
+        country_resolver = await asyncio.to_thread(opener, GEOIP_DB)
+    except Exception as e:
+        print(f"GeoIP database error: {e}")
+
+async def lookup_country_remote(client_ip: str) -> str | None:
+    try:
+        resp = await http_clients["geo"].get(f"http://ip-api.com/json/{client_ip}?fields=countryCode")
+        if resp.status_code == 200:
+            return resp.json().get("countryCode")
+    except Exception:
         pass
-    return "US"
+    return None
+
+async def get_country_from_ip(request) -> str:
+    forwarded = request.headers.get("x-forwarded-for", "").split(",")[0].strip()
+    try:
+        address = ipaddress.ip_address(forwarded or request.client.host)
+    except (ValueError, AttributeError):
+        return DEFAULT_COUNTRY
+    if address.version == 6 and address.ipv4_mapped:
+        address = address.ipv4_mapped
+    if not address.is_global:
+        return DEFAULT_COUNTRY
+    
+    prefix = str(ipaddress.ip_network(f"{address}/{24 if address.version == 4 else 48}", strict=False))
+    cached = geo_cache.get(prefix)
+    if cached is not None:
+        return cached.decode() or DEFAULT_COUNTRY
+    if country_resolver is not None:
+        country = country_resolver(address)
+        # ranges missing from the database are remembered as well, so that they are not searched again
+        geo_cache.set(prefix, (country or "").encode(), GEO_CACHE_TTL)
+    else:
+        country = await lookup_country_remote(str(address))
+        if country:
+            geo_cache.set(prefix, country.encode(), GEO_CACHE_TTL)
+    return country or DEFAULT_COUNTRY
 
 @app.get("/")
 def root():
     return {"status": "ok", "service": "YTMusic API"}
 
+@app.get("/stats")
+def get_stats():
+    return {"success": True, "data": {
+        "stream_urls": {**asdict(stream_urls.stats), "entries": len(stream_urls), "bytes": stream_urls.size},
+        "responses": asdict(response_cache.stats),
+        "prefetch": {**prefetch_stats, "queued": prefetch_queue.qsize()},
+        "piped": {instance: {**vars(health), "score": health.score} for instance, health in piped_health.items()},
+    }}
+
+# countries whose explore payload is rebuilt in the background, in order of priority. "ZZ" is the global chart
+EXPLORE_COUNTRIES = os.getenv(
+    "EXPLORE_COUNTRIES", "ZZ,US,IN,BR,ID,MX,GB,DE,FR,JP,PH,TR,KR,NG,ES,IT,CA,AU,ZA,NL"
+).split(",")
+EXPLORE_TOP_N = int(os.getenv("EXPLORE_TOP_N", "20"))
+EXPLORE_REFRESH = int(os.getenv("EXPLORE_REFRESH", "1800"))
+# snapshots older than this are rebuilt on access, while the old one is still served
+EXPLORE_MAX_AGE = 3600
+# snapshots older than this are not served anymore and the request waits for a rebuild
+EXPLORE_MAX_STALE = 86400
+# country -> (explore payload, build time)
+explore_snapshots = {}
+explore_builds = AsyncSingleFlight()
+# revalidations running in the background, referenced until they finish
+explore_revalidations = set()
+
+def precomputed_countries() -> list:
+    return [c for c in EXPLORE_COUNTRIES if c == "ZZ" or c in SUPPORTED_LOCATIONS][:EXPLORE_TOP_N]
+
+def format_explore(country: str, charts, moods) -> dict:
+    if isinstance(charts, list):
+        return {
+            "country": country,
+            "trending": charts[:20] if charts else [],
+            "top_songs": [],
+            "top_videos": [],
+            "top_artists": [],
+            "moods": moods
+        }
+    return {
+        "country": country,
+        "trending": charts.get("trending", {}).get("items", [])[:20] if isinstance(charts.get("trending"), dict) else [],
+        "top_songs": charts.get("songs", {}).get("items", [])[:20] if isinstance(charts.get("songs"), dict) else [],
+        "top_videos": charts.get("videos", {}).get("items", [])[:20] if isinstance(charts.get("videos"), dict) else [],
+        "top_artists": charts.get("artists", {}).get("items", [])[:20] if isinstance(charts.get("artists"), dict) else [],
+        "moods": moods
+    }
+
+# seconds each upstream call of an explore build may take
+EXPLORE_CALL_TIMEOUT = 15
+
+async def build_explore(country: str) -> dict:
+    # the mood categories do not depend on the country and are answered from the response cache after the first build
+    charts, moods = await ayt.gather(ayt.get_charts(country), ayt.get_mood_categories(), timeout=EXPLORE_CALL_TIMEOUT)
+    if isinstance(charts, Exception):
+        raise charts
+    built = time.time()
+    if isinstance(moods, Exception):
+        print(f"Explore moods error: {moods!r}")
+        moods = {}
+        # the charts are still served, but the next request already revalidates the snapshot
+        built -= EXPLORE_MAX_AGE
+    payload = format_explore(country, charts, moods)
+    explore_snapshots[country] = (payload, built)
+    chart_tracks = [item for item in payload["top_songs"] + payload["trending"] if isinstance(item, dict)]
+    schedule_prefetch([item.get("videoId") for item in chart_tracks][:PREFETCH_CHART_TRACKS], PREFETCH_PRIORITY_CHARTS)
+    return payload
+
+async def rebuild_explore(country: str) -> dict:
+    return await explore_builds.do(country, lambda: build_explore(country))
+
+def revalidate_explore(country: str):
+    task = asyncio.create_task(rebuild_explore(country))
+    explore_revalidations.add(task)
+    task.add_done_callback(explore_revalidations.discard)
+    task.add_done_callback(log_revalidation_error)
+
+def log_revalidation_error(task: asyncio.Task):
+    # the stale snapshot is served until the next attempt
+    if not task.cancelled() and task.exception() is not None:
+        print(f"Explore revalidation error: {task.exception()}")
+
+async def get_explore_snapshot(country: str) -> dict:
+    snapshot = explore_snapshots.get(country)
+    if snapshot is not None:
+        payload, built = snapshot
+        age = time.time() - built
+        if age < EXPLORE_MAX_AGE:
+            return payload
+        if age < EXPLORE_MAX_STALE:
+            revalidate_explore(country)
+            return payload
+    return await rebuild_explore(country)
+
+async def keep_explore_fresh():
+    while True:
+        # one country at a time, so that the refresh never competes with requests for upstream
+        for country in precomputed_countries():
+            try:
+                await rebuild_explore(country)
+            except Exception as e:
+                print(f"Explore refresh error for {country}: {e}")
+        await asyncio.sleep(EXPLORE_REFRESH)
+
+def explore_country(country: str):
+    # only these are kept as snapshots, so that arbitrary query values cannot grow explore_snapshots
+    country = country.upper()
+    return country if country == "ZZ" or country in SUPPORTED_LOCATIONS else None
+
 @app.get("/explore")
 async def get_explore(request: Request, country: str = Query(None)):
+    if country and explore_country(country) is None:
+        raise HTTPException(status_code=400, detail=f"Unsupported country: {country}")
     try:
-        if not country:
-            country = await get_country_from_ip(request)
-        charts = yt.get_charts(country)
-        moods = yt.get_mood_categories()
-        
-        if isinstance(charts, list):
-            return {"success": True, "data": {
-                "country": country,
-                "trending": charts[:20] if charts else [],
-                "top_songs": [],
-                "top_videos": [],
-                "top_artists": [],
-                "moods": moods
-            }}
-        
-        return {"success": True, "data": {
-            "country": country,
-            "trending": charts.get("trending", {}).get("items", [])[:20] if isinstance(charts.get("trending"), dict) else [],
-            "top_songs": charts.get("songs", {}).get("items", [])[:20] if isinstance(charts.get("songs"), dict) else [],
-            "top_videos": charts.get("videos", {}).get("items", [])[:20] if isinstance(charts.get("videos"), dict) else [],
-            "top_artists": charts.get("artists", {}).get("items", [])[:20] if isinstance(charts.get("artists"), dict) else [],
-            "moods": moods
-        }}
+        if country:
+            country = explore_country(country)
+        else:
+            country = explore_country(await get_country_from_ip(request)) or DEFAULT_COUNTRY
+        return {"success": True, "data": await get_explore_snapshot(country)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/search")
-def search(query: str = Query(...), filter: str = Query(None), limit: int = Query(20), ignore_spelling: bool = Query(False)):
+async def search(query: str = Query(...), filter: str = Query(None), limit: int = Query(20), ignore_spelling: bool = Query(False)):
     try:
         clean_filter = filter if filter and filter.strip() else None
-        results = yt.search(query, filter=clean_filter, limit=limit, ignore_spelling=ignore_spelling)
+        results = await ayt.search(query, filter=clean_filter, limit=limit, ignore_spelling=ignore_spelling)
         formatted = [format_track(item) if item.get("resultType") in ["song", "video"] else item for item in results]
         return {"success": True, "data": formatted}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/search/suggestions")
-def search_suggestions(query: str = Query(...)):
+async def search_suggestions(query: str = Query(...)):
     try:
-        return {"success": True, "data": yt.get_search_suggestions(query)}
+        return {"success": True, "data": await ayt.get_search_suggestions(query)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/home")
-def get_home(limit: int = Query(6)):
+async def get_home(limit: int = Query(6)):
     try:
-        return {"success": True, "data": yt.get_home(limit=limit)}
+        return {"success": True, "data": await ayt.get_home(limit=limit)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# the song endpoints only read the metadata, the stream urls come from Piped
+SONG_DETAILS = ("videoDetails",)
+
+def format_song(video_id: str, song: dict, in_r2: bool) -> dict:
+    details = song.get("videoDetails", {})
+    thumbnails = details.get("thumbnail", {}).get("thumbnails", [])
+    return {
+        "id": video_id, 
+        "title": details.get("title"), 
+        "artist": details.get("author"),
+        "duration": int(details.get("lengthSeconds", 0)), 
+        "cover": get_best_thumbnail(thumbnails),
+        "views": details.get("viewCount"), 
+        "stream_url": f"/stream/{video_id}",
+        "cached": in_r2
+    }
+
 @app.get("/song/{video_id}")
 async def get_song(video_id: str):
     try:
-        song = yt.get_song(video_id)
-        details = song.get("videoDetails", {})
-        thumbnails = details.get("thumbnail", {}).get("thumbnails", [])
-        
-        in_r2 = check_r2_exists(video_id)
-        
-        return {"success": True, "data": {
-            "id": video_id, 
-            "title": details.get("title"), 
-            "artist": details.get("author"),
-            "duration": int(details.get("lengthSeconds", 0)), 
-            "cover": get_best_thumbnail(thumbnails),
-            "views": details.get("viewCount"), 
-            "stream_url": f"/stream/{video_id}",
-            "cached": in_r2
-        }}
+        song = await ayt.get_song(video_id, fields=SONG_DETAILS)
+        in_r2 = await check_r2_exists(video_id)
+        return {"success": True, "data": format_song(video_id, song, in_r2)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+SONGS_BATCH_LIMIT = 500
+# player requests sent at the same time per batch
+SONGS_BATCH_CONCURRENCY = 16
+# R2 HEAD requests per batch, each one occupies a thread of the default executor
+SONGS_BATCH_R2_CONCURRENCY = 16
+
+async def batch_in_r2(video_ids: list[str]) -> list[bool]:
+    slots = asyncio.Semaphore(SONGS_BATCH_R2_CONCURRENCY)
+
+    async def in_r2(video_id: str) -> bool:
+        if video_id in r2_index:
+            return True
+        # a batch only reports the flag, so the listing is trusted until its next refresh
+        if r2_index_complete or video_id in r2_missing:
+            return False
+        async with slots:
+            return await check_r2_exists(video_id)
+
+    return await asyncio.gather(*(in_r2(video_id) for video_id in video_ids))
+
+@app.post("/songs/batch")
+async def get_songs_batch(ids: list[str] = Body(..., embed=True)):
+    if len(ids) > SONGS_BATCH_LIMIT:
+        raise HTTPException(status_code=400, detail=f"At most {SONGS_BATCH_LIMIT} ids per batch")
+    unique = list(dict.fromkeys(ids))
+    songs, in_r2 = await asyncio.gather(
+        ayt.get_songs(unique, max_concurrency=SONGS_BATCH_CONCURRENCY, fields=SONG_DETAILS),
+        batch_in_r2(unique)
+    )
+    results = {}
+    for video_id, song, cached in zip(unique, songs, in_r2):
+        try:
+            if isinstance(song, Exception):
+                raise song
+            results[video_id] = {"id": video_id, "success": True, "data": format_song(video_id, song, cached)}
+        except Exception as e:
+            results[video_id] = {"id": video_id, "success": False, "error": str(e)}
+    return {"success": True, "data": [results[video_id] for video_id in ids]}
+
+# headers of the upstream audio response that describe the (partial) body and are passed to the client
+PASSTHROUGH_HEADERS = ("content-range", "content-length", "content-type", "last-modified", "etag")
+
+def is_full_request(range_header: str | None) -> bool:
+    return not range_header or range_header.replace(" ", "") == "bytes=0-"
+
 @app.get("/stream/{video_id}")
-async def stream_audio(video_id: str):
-    if check_r2_exists(video_id):
-        url = get_r2_url(video_id)
+async def stream_audio(video_id: str, request: Request):
+    if await check_r2_exists(video_id):
+        url, max_age = get_r2_url(video_id)
         if url:
-            return RedirectResponse(url=url, status_code=302)
+            # browsers resend the Range header to the new location, R2 answers it with a 206 itself.
+            # the target stays the same while the signature is reused, so the redirect may be cached as well
+            return RedirectResponse(
+                url=url, status_code=302, headers={"Cache-Control": f"private, max-age={max_age}"}
+            )
     
     audio_info = await get_audio_url_from_piped(video_id)
     if not audio_info:
         raise HTTPException(status_code=404, detail="No audio found")
     
     audio_url = audio_info["url"]
+    range_header = request.headers.get("range")
     
-    asyncio.create_task(download_and_cache(video_id, audio_url))
+    client = http_clients["audio"]
+    upstream_headers = {"Range": range_header} if range_header and range_header.startswith("bytes=") else {}
+    try:
+        resp = await client.send(client.build_request("GET", audio_url, headers=upstream_headers), stream=True)
+    except httpx.HTTPError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+    
+    async def close_upstream():
+        # returns the connection to the shared pool
+        await resp.aclose()
+    
+    if resp.status_code not in (200, 206):
+        await close_upstream()
+        if resp.status_code == 416:
+            raise HTTPException(status_code=416, detail="Requested range not satisfiable")
+        raise HTTPException(status_code=502, detail=f"Upstream returned {resp.status_code}")
+    
+    # the single upstream download is copied into R2 while it is sent to the client.
+    # seeks only fetch the requested bytes, the whole file is cached from the initial request
+    chunks = resp.aiter_raw(chunk_size=65536)
+    if is_full_request(range_header) and is_complete_body(resp) and video_id not in cache_fills:
+        content_length = resp.headers.get("content-length")
+        chunks = tee_to_r2(video_id, chunks, int(content_length) if content_length else None)
     
     async def stream_generator():
-        async with httpx.AsyncClient(timeout=httpx.Timeout(300, connect=10)) as client:
-            async with client.stream("GET", audio_url) as resp:
-                async for chunk in resp.aiter_bytes(chunk_size=65536):
-                    yield chunk
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+            await close_upstream()
     
+    headers = {name: resp.headers[name] for name in PASSTHROUGH_HEADERS if name in resp.headers}
+    headers.update({"Accept-Ranges": "bytes", "Cache-Control": "public, max-age=3600"})
     return StreamingResponse(
-        stream_generator(), 
-        media_type="audio/webm",
-        headers={"Accept-Ranges": "bytes", "Cache-Control": "public, max-age=3600"}
+        stream_generator(),
+        status_code=resp.status_code,
+        media_type=headers.pop("content-type", "audio/webm"),
+        headers=headers,
+        # also runs if the client disconnects before the generator is started
+        background=BackgroundTask(close_upstream)
     )
 
 @app.get("/artist/{artist_id}")
-def get_artist(artist_id: str):
+async def get_artist(artist_id: str):
     try:
-        artist = yt.get_artist(artist_id)
+        artist = await ayt.get_artist(artist_id)
         artist["cover"] = get_best_thumbnail(artist.get("thumbnails", []))
         return {"success": True, "data": artist}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/album/{album_id}")
-def get_album(album_id: str):
+async def get_album(album_id: str):
     try:
-        album = yt.get_album(album_id)
+        album = await ayt.get_album(album_id)
         cover = get_best_thumbnail(album.get("thumbnails", []))
         tracks = []
         for t in album.get("tracks", []):
@@ -293,10 +1130,23 @@ def get_album(album_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def ndjson_tracks(tracks):
+    for t in tracks:
+        yield json_backend.dumps(format_track(t)) + b"\n"
+
 @app.get("/playlist/{playlist_id}")
-def get_playlist(playlist_id: str, limit: int = Query(100)):
+def get_playlist(playlist_id: str, limit: int = Query(100), stream: bool = Query(False)):
+    if stream:
+        # one formatted track per line, sent while the following pages are still being fetched
+        try:
+            tracks = yt.iter_playlist(playlist_id, limit=limit, as_models=True)
+            first = list(itertools.islice(tracks, 1))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        return StreamingResponse(ndjson_tracks(itertools.chain(first, tracks)), media_type="application/x-ndjson")
     try:
-        playlist = yt.get_playlist(playlist_id, limit=limit)
+        # tracks are parsed into slotted models, which are formatted without an intermediate dict
+        playlist = yt.get_playlist(playlist_id, limit=limit, as_models=True)
         playlist["cover"] = get_best_thumbnail(playlist.get("thumbnails", []))
         tracks = [format_track(t) for t in playlist.get("tracks", [])]
         playlist["tracks"] = tracks
@@ -305,35 +1155,37 @@ def get_playlist(playlist_id: str, limit: int = Query(100)):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/radio/{video_id}")
-def get_radio(video_id: str, limit: int = Query(25)):
+async def get_radio(video_id: str, limit: int = Query(25)):
     try:
-        results = yt.get_watch_playlist(videoId=video_id, limit=limit)
+        results = await ayt.get_watch_playlist(videoId=video_id, limit=limit)
         tracks = [format_track(t) for t in results.get("tracks", [])]
+        # the first track is the one just requested, the following ones are played next
+        schedule_prefetch([t["id"] for t in tracks[1:PREFETCH_RADIO_TRACKS + 1]], PREFETCH_PRIORITY_RADIO)
         return {"success": True, "data": {"playlistId": results.get("playlistId"), "tracks": tracks}}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/lyrics/{video_id}")
-def get_lyrics(video_id: str):
+async def get_lyrics(video_id: str):
     try:
-        watch = yt.get_watch_playlist(video_id)
+        watch = await ayt.get_watch_playlist(video_id)
         if watch and "lyrics" in watch:
-            return {"success": True, "data": yt.get_lyrics(watch["lyrics"])}
+            return {"success": True, "data": await ayt.get_lyrics(watch["lyrics"])}
         return {"success": False, "data": None, "error": "No lyrics"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/charts")
-def get_charts(country: str = Query("ZZ")):
+async def get_charts(country: str = Query("ZZ")):
     try:
-        return {"success": True, "data": yt.get_charts(country)}
+        return {"success": True, "data": await ayt.get_charts(country)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/moods")
-def get_mood_categories():
+async def get_mood_categories():
     try:
-        return {"success": True, "data": yt.get_mood_categories()}
+        return {"success": True, "data": await ayt.get_mood_categories()}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
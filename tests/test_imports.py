@@ -0,0 +1,30 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def imported_modules(statement: str) -> set[str]:
+    """:return: modules loaded by a fresh interpreter after running the statement"""
+    code = f"import sys, json; {statement}; print(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return set(json.loads(result.stdout))
+
+
+def test_import_package_is_lazy():
+    modules = imported_modules("import ytmusicapi")
+    loaded = sorted(
+        module
+        for module in modules
+        if module.split(".")[0] in ("requests", "httpx", "webbrowser")
+        or module.startswith(("ytmusicapi.auth", "ytmusicapi.mixins", "ytmusicapi.ytmusic", "ytmusicapi.setup"))
+    )
+    assert loaded == []
+
+
+def test_sync_client_skips_auth_flows():
+    modules = imported_modules("from ytmusicapi import YTMusic")
+    assert "ytmusicapi.ytmusic" in modules
+    assert not {"webbrowser", "httpx", "ytmusicapi.auth.oauth", "ytmusicapi.async_ytmusic"} & modules
@@ -0,0 +1,37 @@
+import pytest
+
+from ytmusicapi.models import Track
+from ytmusicapi.parsers.playlists import parse_playlist_items
+
+
+def column(text: str) -> dict:
+    return {"musicResponsiveListItemFlexColumnRenderer": {"text": {"runs": [{"text": text}]}}}
+
+
+def playlist_item(available: bool = True) -> dict:
+    renderer = {
+        "flexColumns": [column("Song"), column("Artist"), column("Album")],
+        "fixedColumns": [{"musicResponsiveListItemFixedColumnRenderer": {"text": {"runs": [{"text": "3:25"}]}}}],
+        "overlay": {
+            "musicItemThumbnailOverlayRenderer": {
+                "content": {"musicPlayButtonRenderer": {"playNavigationEndpoint": {"watchEndpoint": {"videoId": "v"}}}}
+            }
+        },
+        "index": {"runs": [{"text": "7"}]},
+    }
+    if not available:
+        renderer["musicItemRendererDisplayPolicy"] = "MUSIC_ITEM_RENDERER_DISPLAY_POLICY_GREY_OUT"
+    return {"musicResponsiveListItemRenderer": renderer}
+
+
+@pytest.mark.parametrize(
+    ("is_album", "available", "track_number"),
+    [(False, True, "absent"), (True, True, 7), (True, False, None)],
+)
+def test_track_number_round_trip(is_album, available, track_number):
+    items = [playlist_item(available)]
+    track = parse_playlist_items(items, is_album=is_album)[0]
+    model = parse_playlist_items(items, is_album=is_album, as_models=True)[0]
+    assert track.get("trackNumber", "absent") == track_number
+    assert model.to_dict() == track
+    assert Track.from_dict(track) == model
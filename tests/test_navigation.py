@@ -0,0 +1,24 @@
+from ytmusicapi.navigation import CAROUSEL_TITLE, NAVIGATION_BROWSE, SECTION, SINGLE_COLUMN_TAB, NavPath, nav
+from ytmusicapi.parsers.i18n import get_parser
+
+
+def test_concatenation_accepts_lists():
+    path = CAROUSEL_TITLE + NAVIGATION_BROWSE + ["params"]
+    assert isinstance(path, NavPath)
+    assert list(path) == [*CAROUSEL_TITLE, *NAVIGATION_BROWSE, "params"]
+    assert ["contents", 0] + SECTION == NavPath("contents", 0, *SECTION)
+    assert len(SINGLE_COLUMN_TAB + SECTION + ["endItems", 0]) == len(SINGLE_COLUMN_TAB) + len(SECTION) + 2
+
+
+def test_artist_carousel_paths():
+    title = {
+        "text": "Albums",
+        "navigationEndpoint": {"browseEndpoint": {"browseId": "MPAD123", "params": "abc"}},
+    }
+    carousel = {
+        "header": {"musicCarouselShelfBasicHeaderRenderer": {"title": {"runs": [title]}}},
+        "contents": [],
+    }
+    artist = get_parser("en").parse_channel_contents([{"musicCarouselShelfRenderer": carousel}])
+    assert artist["albums"] == {"browseId": "MPAD123", "params": "abc", "results": []}
+    assert nav(carousel, CAROUSEL_TITLE + NAVIGATION_BROWSE + ["params"]) == "abc"
@@ -1,17 +1,47 @@
-from importlib.metadata import PackageNotFoundError, version
+import typing
+from importlib import import_module
 
-from ytmusicapi.auth.oauth.credentials import OAuthCredentials
-from ytmusicapi.models.content.enums import LikeStatus
-from ytmusicapi.setup import setup, setup_oauth
-from ytmusicapi.ytmusic import YTMusic
+if typing.TYPE_CHECKING:
+    from ytmusicapi.async_ytmusic import AsyncYTMusic
+    from ytmusicapi.auth.oauth.credentials import OAuthCredentials
+    from ytmusicapi.models.content.enums import LikeStatus
+    from ytmusicapi.setup import setup, setup_oauth
+    from ytmusicapi.ytmusic import YTMusic
+
+# the exports are imported on first access, so that importing a submodule like ytmusicapi.cache
+# or only the synchronous client does not load the asynchronous client, the auth flows and their dependencies
+_LAZY_EXPORTS = {
+    "AsyncYTMusic": "ytmusicapi.async_ytmusic",
+    "LikeStatus": "ytmusicapi.models.content.enums",
+    "OAuthCredentials": "ytmusicapi.auth.oauth.credentials",
+    "YTMusic": "ytmusicapi.ytmusic",
+    "setup": "ytmusicapi.setup",
+    "setup_oauth": "ytmusicapi.setup",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name]), name)
+    elif name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            value = version("ytmusicapi")
+        except PackageNotFoundError:
+            # package is not installed
+            raise AttributeError(name) from None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_EXPORTS])
 
-try:
-    __version__ = version("ytmusicapi")
-except PackageNotFoundError:
-    # package is not installed
-    pass
 
 __copyright__ = "Copyright 2024 sigma67"
 __license__ = "MIT"
 __title__ = "ytmusicapi"
-__all__ = ["LikeStatus", "OAuthCredentials", "YTMusic", "setup", "setup_oauth"]
+__all__ = ["AsyncYTMusic", "LikeStatus", "OAuthCredentials", "YTMusic", "setup", "setup_oauth"]
@@ -0,0 +1,385 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import inspect
+import json
+from collections.abc import AsyncIterator, Awaitable, Callable, Collection, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from functools import partial, wraps
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from requests.structures import CaseInsensitiveDict
+
+from ytmusicapi.cache import CachePolicy, ResponseCache
+from ytmusicapi.helpers import initialize_headers
+from ytmusicapi.mixins.browsing import BrowsingMixin
+from ytmusicapi.mixins.charts import ChartsMixin
+from ytmusicapi.mixins.explore import ExploreMixin
+from ytmusicapi.mixins.library import LibraryMixin
+from ytmusicapi.mixins.playlists import PlaylistsMixin
+from ytmusicapi.mixins.podcasts import PodcastsMixin
+from ytmusicapi.mixins.search import SearchMixin
+from ytmusicapi.mixins.uploads import UploadsMixin
+from ytmusicapi.mixins.watch import WatchMixin
+from ytmusicapi.singleflight import AsyncSingleFlight
+
+from .auth.types import AuthType
+from .exceptions import YTMusicUserError
+from .type_alias import JsonDict
+from .ytmusic import RawResponse, YTMusicBase
+
+if TYPE_CHECKING:
+    from .auth.oauth import OAuthCredentials
+
+#: default number of worker threads per instance, see the ``max_threads`` argument of :py:class:`AsyncYTMusic`
+MAX_THREADS = 32
+
+#: methods that block outside of the requests they send, e.g. on file uploads, and always run on a worker thread
+_THREADED_METHODS = {"upload_song"}
+
+
+class _PendingRequest(BaseException):
+    """
+    Raised from inside the synchronous mixin code running on the event loop when it needs a response
+    that has not been fetched yet.
+
+    Derives from BaseException so that it can never be swallowed by an ``except Exception`` in a parser.
+    """
+
+    def __init__(self, key: tuple[str, str, int], request: httpx.Request, coalesce_key: str | None):
+        super().__init__(request.url)
+        self.key = key
+        self.request = request
+        self.coalesce_key = coalesce_key
+
+
+class _Replay:
+    """
+    responses recorded for one public method call
+
+    Responses are keyed by method, url and the number of previous requests to the same url,
+    so that requests skipped on a later run (e.g. answered from the cache) do not shift the others.
+    """
+
+    def __init__(self) -> None:
+        self.responses: dict[tuple[str, str, int], httpx.Response] = {}
+        self.occurrences: dict[tuple[str, str], int] = {}
+        #: cache keys already looked up in vain on a previous run
+        self.cache_misses: set[str] = set()
+
+    def restart(self) -> None:
+        self.occurrences.clear()
+
+    def next_key(self, method: str, url: str) -> tuple[str, str, int]:
+        occurrence = self.occurrences.get((method, url), 0)
+        self.occurrences[(method, url)] = occurrence + 1
+        return method, url, occurrence
+
+
+class _Bridge:
+    """
+    sends the requests of a method running on a worker thread through the event loop
+
+    :param replay: Optional. Responses fetched before the method moved to the thread, which are not requested again.
+    """
+
+    def __init__(self, client: AsyncYTMusicBase, loop: asyncio.AbstractEventLoop, replay: _Replay | None = None):
+        self.client = client
+        self.loop = loop
+        self.replay = replay or _Replay()
+        self.replay.restart()
+
+    def send(self, key: tuple[str, str, int], request: httpx.Request, coalesce_key: str | None) -> httpx.Response:
+        if key in self.replay.responses:
+            return self.replay.responses[key]
+        return asyncio.run_coroutine_threadsafe(self.client._fetch(request, coalesce_key), self.loop).result()
+
+
+#: the recorded responses of a call running on the event loop, or the bridge of a call running on a worker thread
+_call: ContextVar[_Replay | _Bridge | None] = ContextVar("ytmusicapi_call", default=None)
+
+#: marks the end of a generator method, as StopIteration cannot cross a thread boundary
+_EXHAUSTED = object()
+
+
+class AsyncYTMusicBase(YTMusicBase):
+    def __init__(
+        self,
+        auth: str | JsonDict | None = None,
+        user: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        proxies: dict[str, str] | None = None,
+        language: str = "en",
+        location: str = "",
+        oauth_credentials: OAuthCredentials | None = None,
+        cache: ResponseCache | None = None,
+        cache_policy: CachePolicy | None = None,
+        max_threads: int = MAX_THREADS,
+    ):
+        """
+        Create a new asyncio instance to interact with YouTube Music.
+
+        Accepts the same arguments as :py:class:`YTMusic`, except that the ``requests_session``
+        is replaced by an ``httpx.AsyncClient``.
+
+        :param http_client: Optional. An ``httpx.AsyncClient`` to send all requests with.
+          Default: a client with a request timeout of 30s is created and closed by :py:meth:`aclose`.
+        :param max_threads: Optional. Worker threads for the method calls that need more than one request,
+          the ``iter_*`` methods excepted. Each of these calls holds a thread until it completes,
+          further calls wait for a free one. Default: 32
+        """
+        super().__init__(
+            auth=auth,
+            user=user,
+            proxies=proxies,
+            language=language,
+            location=location,
+            oauth_credentials=oauth_credentials,
+            cache=cache,
+            cache_policy=cache_policy,
+            # each page is requested through the event loop by the thread running the call
+            max_inflight_continuations=0,
+        )
+        #: runs the synchronous mixin methods that need more than one request, see :py:meth:`_run`
+        self._executor = ThreadPoolExecutor(max_threads, thread_name_prefix="ytmusicapi-async")
+        self._owns_client = http_client is None
+        #: async http client for connection pooling
+        self._client = http_client or self._prepare_client(proxies)
+        #: coalesces identical concurrent read-only requests
+        self._async_inflight: AsyncSingleFlight[httpx.Response] = AsyncSingleFlight()
+
+    @staticmethod
+    def _prepare_client(proxies: dict[str, str] | None) -> httpx.AsyncClient:
+        """Create an httpx client, translating requests-style proxies to httpx mounts"""
+        mounts = {
+            f"{scheme}://": httpx.AsyncHTTPTransport(proxy=proxy) for scheme, proxy in (proxies or {}).items()
+        }
+        return httpx.AsyncClient(timeout=30, mounts=mounts or None)
+
+    def _with_cookies(self, headers: CaseInsensitiveDict[str]) -> dict[str, str]:
+        # requests only adds the cookies argument if no cookie header is present, mirror that
+        headers = headers.copy()
+        if "cookie" not in headers:
+            headers["cookie"] = "; ".join(f"{name}={value}" for name, value in self.cookies.items())
+        return dict(headers)
+
+    def _call_response(
+        self, method: str, url: str, request: Callable[[], httpx.Request], coalesce_key: str | None = None
+    ) -> httpx.Response:
+        call = _call.get()
+        if call is None:
+            raise YTMusicUserError("AsyncYTMusic requests can only be sent from within an awaited method call")
+        if isinstance(call, _Bridge):
+            return call.send(call.replay.next_key(method, url), request(), coalesce_key)
+        key = call.next_key(method, url)
+        if key not in call.responses:
+            raise _PendingRequest(key, request(), coalesce_key)
+        return call.responses[key]
+
+    def _cache_get(self, cache: ResponseCache, key: str) -> bytes | None:
+        call = _call.get()
+        if not isinstance(call, _Replay):
+            return cache.get(key)
+        if key in call.cache_misses:
+            return None
+        value = cache.get(key)
+        if value is None:
+            call.cache_misses.add(key)
+        return value
+
+    def _post_request(self, url: str, body: JsonDict, coalesce_key: str | None = None) -> RawResponse:
+        headers = self._with_cookies(self.headers)
+        # the body is part of the key, as requests answered from the cache are skipped on later runs
+        digest = hashlib.sha1(json.dumps(body, sort_keys=True).encode("utf-8")).hexdigest()
+        response = self._call_response(
+            "POST",
+            url + "#" + digest,
+            lambda: self._client.build_request("POST", url, json=body, headers=headers),
+            coalesce_key,
+        )
+        return RawResponse(response.status_code, response.reason_phrase, response.content)
+
+    def _send_get_request(  # type: ignore[override]
+        self, url: str, params: JsonDict | None = None, use_base_headers: bool = False
+    ) -> httpx.Response:
+        # handle first-use x-goog-visitor-id fetching
+        headers = self._with_cookies(initialize_headers() if use_base_headers else self.headers)
+        return self._call_response(
+            "GET", url, lambda: self._client.build_request("GET", url, params=params, headers=headers)
+        )
+
+    async def _fetch(self, request: httpx.Request, coalesce_key: str | None = None) -> httpx.Response:
+        if coalesce_key is not None:
+            return await self._async_inflight.do(coalesce_key, partial(self._client.send, request))
+        return await self._client.send(request)
+
+    async def _run(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Runs a synchronous mixin method until it completes.
+
+        The method starts on the event loop. When it needs its first response, the request is awaited
+        and the method is run again, receiving the recorded response, so that calls with a single request
+        do not hold a thread. A method that needs a second response moves to a worker thread, where it runs
+        once more with the recorded response and sends its further requests through the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if method.__name__ in _THREADED_METHODS or self.auth_type == AuthType.OAUTH_CUSTOM_CLIENT:
+            # blocks outside of its requests, or may refresh the oauth token with a blocking request
+            return await self._run_threaded(loop, method, _Replay(), *args, **kwargs)
+        if method is not _resolve_base_headers and "base_headers" not in self.__dict__:
+            # the visitor id is requested once per instance, before the first call
+            await self._run(_resolve_base_headers)
+
+        replay = _Replay()
+        while True:
+            replay.restart()
+            token = _call.set(replay)
+            try:
+                return method(self, *args, **kwargs)
+            except _PendingRequest as pending:
+                if replay.responses:
+                    return await self._run_threaded(loop, method, replay, *args, **kwargs)
+                key, request, coalesce_key = pending.key, pending.request, pending.coalesce_key
+            finally:
+                _call.reset(token)
+            replay.responses[key] = await self._fetch(request, coalesce_key)
+
+    async def _run_threaded(
+        self, loop: asyncio.AbstractEventLoop, method: Callable[..., Any], replay: _Replay, *args: Any, **kwargs: Any
+    ) -> Any:
+        context = copy_context()
+        context.run(_call.set, _Bridge(self, loop, replay))
+        return await loop.run_in_executor(self._executor, context.run, partial(method, self, *args, **kwargs))
+
+    async def _iterate(self, method: Callable[..., Iterator[Any]], *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        """
+        Runs a synchronous generator method on a dedicated worker thread, item by item.
+        Its requests are sent on the event loop, which stays responsive while pages are parsed.
+        """
+        loop = asyncio.get_running_loop()
+        context = copy_context()
+        context.run(_call.set, _Bridge(self, loop))
+        iterator = context.run(method, self, *args, **kwargs)
+        # a single thread, so that closing waits for a step that is still running
+        executor = ThreadPoolExecutor(1, thread_name_prefix="ytmusicapi-iterate")
+        try:
+            while True:
+                item = await loop.run_in_executor(executor, context.run, next, iterator, _EXHAUSTED)
+                if item is _EXHAUSTED:
+                    return
+                yield item
+        finally:
+            await loop.run_in_executor(executor, context.run, iterator.close)
+            executor.shutdown(wait=False)
+
+    async def gather(self, *calls: Awaitable[Any], timeout: float | None = None) -> list[Any]:
+        """
+        Awaits independent method calls concurrently, so that their requests overlap
+        and the total latency is that of the slowest call::
+
+            charts, moods = await ytmusic.gather(
+                ytmusic.get_charts("US"), ytmusic.get_mood_categories(), timeout=10
+            )
+
+        A failing call does not affect the others, its exception is returned in place of its result.
+
+        :param calls: awaitables returned by the methods of this instance
+        :param timeout: Optional. Seconds each call may take, a slower call is cancelled
+          and results in an ``asyncio.TimeoutError``. Default: no limit
+        :return: results or exceptions, in the order of the calls
+        """
+        return await asyncio.gather(*(asyncio.wait_for(call, timeout) for call in calls), return_exceptions=True)
+
+    async def aclose(self) -> None:
+        """Close the underlying http client, if it was created by this instance"""
+        self._executor.shutdown(wait=False)
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncYTMusicBase:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+def _resolve_base_headers(self: AsyncYTMusicBase) -> None:
+    self.base_headers
+
+
+def _make_async(method: Callable[..., Any]) -> Callable[..., Any]:
+    run = AsyncYTMusicBase._iterate if inspect.isgeneratorfunction(method) else AsyncYTMusicBase._run
+
+    @wraps(method)
+    def wrapper(self: AsyncYTMusicBase, *args: Any, **kwargs: Any) -> Any:
+        # mixin methods calling each other stay synchronous within the current call
+        if _call.get() is not None:
+            return method(self, *args, **kwargs)
+        return run(self, method, *args, **kwargs)
+
+    return wrapper
+
+
+class AsyncYTMusic(
+    AsyncYTMusicBase,
+    BrowsingMixin,
+    SearchMixin,
+    WatchMixin,
+    ChartsMixin,
+    ExploreMixin,
+    LibraryMixin,
+    PlaylistsMixin,
+    PodcastsMixin,
+    UploadsMixin,
+):
+    """
+    asyncio variant of :py:class:`YTMusic` with the same methods, which have to be awaited.
+    All requests are sent on the event loop through ``httpx``::
+
+        async with AsyncYTMusic() as ytmusic:
+            results = await ytmusic.search("Oasis Wonderwall")
+
+    Methods that send a single request, like :py:meth:`search` or :py:meth:`get_song`, parse the response
+    on the event loop and use no threads. Methods that need further requests, e.g. to fetch more pages,
+    move to one of ``max_threads`` worker threads, which they hold while waiting for each of their requests.
+    At most ``max_threads`` such calls are in progress at the same time, the others wait for a free thread.
+    The same applies to :py:meth:`upload_song`, which transfers the file with blocking ``requests`` calls,
+    and to all methods when authenticating with :py:class:`OAuthCredentials`, whose tokens are refreshed
+    with blocking requests.
+
+    The ``iter_*`` methods return asynchronous iterators instead, which parse page by page
+    on a dedicated worker thread::
+
+        async for track in ytmusic.iter_playlist(playlistId, limit=None):
+            ...
+    """
+
+    async def get_songs(
+        self,
+        videoIds: list[str],
+        signatureTimestamp: int | None = None,
+        max_concurrency: int = 8,
+        fields: Collection[str] | None = None,
+    ) -> list[JsonDict | Exception]:
+        # awaits the individual calls concurrently, each without a thread, instead of running them on a single one
+        slots = asyncio.Semaphore(max_concurrency)
+
+        async def get_song(videoId: str) -> JsonDict:
+            async with slots:
+                return await self.get_song(videoId, signatureTimestamp, fields)
+
+        unique = list(dict.fromkeys(videoIds))
+        results = dict(zip(unique, await self.gather(*(get_song(videoId) for videoId in unique))))
+        return [results[videoId] for videoId in videoIds]
+
+    get_songs.__doc__ = BrowsingMixin.get_songs.__doc__
+
+
+for _mixin in AsyncYTMusic.__bases__[1:]:
+    for _name, _member in vars(_mixin).items():
+        # methods implemented natively above are kept
+        if not _name.startswith("_") and inspect.isfunction(_member) and _name not in vars(AsyncYTMusic):
+            setattr(AsyncYTMusic, _name, _make_async(_member))
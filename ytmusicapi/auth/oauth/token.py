@@ -1,6 +1,5 @@
 import json
 import time
-import webbrowser
 from collections.abc import KeysView
 from dataclasses import dataclass
 from pathlib import Path
@@ -125,6 +124,8 @@ class RefreshingToken(OAuthToken):
         code = credentials.get_code()
         url = f"{code['verification_url']}?user_code={code['user_code']}"
         if open_browser:
+            import webbrowser
+
             webbrowser.open(url)
         input(f"Go to {url} , finish the login flow and press Enter when done, Ctrl-C to abort")
         raw_token = credentials.token_from_code(code["device_code"])
@@ -0,0 +1,269 @@
+"""response caches for :py:class:`YTMusic`, see the ``cache`` argument"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Collection
+from dataclasses import dataclass
+from pathlib import Path
+
+from ytmusicapi.type_alias import JsonDict
+
+#: default time to live in seconds per endpoint, endpoints not listed here are never cached
+DEFAULT_ENDPOINT_TTLS: dict[str, float] = {
+    "browse": 600,
+    "search": 600,
+    "next": 300,
+    "player": 300,
+    "music/get_search_suggestions": 3600,
+}
+
+#: default time to live in seconds for browse requests, by browseId prefix
+DEFAULT_BROWSE_TTLS: dict[str, float] = {
+    "FEmusic_charts": 6 * 3600,
+    "FEmusic_moods_and_genres": 6 * 3600,
+    "FEmusic_explore": 3600,
+    "MPRE": 24 * 3600,
+}
+
+
+@dataclass
+class CacheStats:
+    """Counters of a cache tier"""
+
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    #: entries removed to stay within the size limits
+    evictions: int = 0
+    #: entries removed because their time to live had passed
+    expired: int = 0
+
+
+@dataclass
+class CachePolicy:
+    """
+    Decides whether and for how long a request is cached.
+
+    :param endpoint_ttls: time to live in seconds per endpoint.
+        Endpoints not listed are never cached, which includes all mutating endpoints
+        like ``like/like`` or ``browse/edit_playlist``.
+    :param browse_ttls: time to live in seconds for ``browse`` requests whose browseId starts with the key.
+        Takes precedence over the ``browse`` entry of ``endpoint_ttls``.
+    :param authenticated: Whether to cache authenticated requests. Default: False,
+        since library pages change with every edit of the user.
+    """
+
+    endpoint_ttls: dict[str, float] | None = None
+    browse_ttls: dict[str, float] | None = None
+    authenticated: bool = False
+
+    def read_only(self, endpoint: str) -> bool:
+        """
+        :return: True if requests to the endpoint have no side effects
+        """
+        endpoint_ttls = DEFAULT_ENDPOINT_TTLS if self.endpoint_ttls is None else self.endpoint_ttls
+        return endpoint in endpoint_ttls
+
+    def ttl(self, endpoint: str, body: JsonDict, authenticated: bool) -> float | None:
+        """
+        :return: time to live in seconds for the request, None if it must not be cached
+        """
+        if authenticated and not self.authenticated:
+            return None
+
+        endpoint_ttls = DEFAULT_ENDPOINT_TTLS if self.endpoint_ttls is None else self.endpoint_ttls
+        ttl = endpoint_ttls.get(endpoint)
+        if ttl is None or endpoint != "browse":
+            return ttl
+
+        browse_id = body.get("browseId", "")
+        browse_ttls = DEFAULT_BROWSE_TTLS if self.browse_ttls is None else self.browse_ttls
+        for prefix, browse_ttl in browse_ttls.items():
+            if browse_id.startswith(prefix):
+                return browse_ttl
+        return ttl
+
+
+def request_cache_key(
+    endpoint: str, body: JsonDict, additionalParams: str, identity: str, fields: Collection[str] | None = None
+) -> str:
+    """
+    Canonical hash of a request.
+
+    :param body: request body including the context, which carries language, location and user
+    :param identity: digest of the authentication in use, empty if unauthenticated
+    :param fields: subtrees the cached response was reduced to, see ``YTMusicBase._send_request``
+    """
+    key = [endpoint, body, additionalParams, identity]
+    if fields is not None:
+        key.append(sorted(fields))
+    canonical = json.dumps(key, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResponseCache(ABC):
+    """Base class of response caches. Values are raw response bodies with an absolute expiry time."""
+
+    def __init__(self) -> None:
+        self.stats = CacheStats()
+
+    @abstractmethod
+    def get_entry(self, key: str) -> tuple[bytes, float] | None:
+        """
+        :return: cached value and its expiry timestamp, None if absent or expired
+        """
+
+    @abstractmethod
+    def set_entry(self, key: str, value: bytes, expires: float) -> None:
+        """Store a value until the given expiry timestamp"""
+
+    def get(self, key: str) -> bytes | None:
+        entry = self.get_entry(key)
+        return entry[0] if entry else None
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.set_entry(key, value, time.time() + ttl)
+
+
+class MemoryCache(ResponseCache):
+    """
+    Thread-safe in-process LRU cache.
+
+    :param maxsize: maximum number of entries
+    :param maxbytes: maximum total size of the cached values
+    """
+
+    def __init__(self, maxsize: int = 1024, maxbytes: int = 256 * 1024 * 1024) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.size = 0
+        self._entries: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_entry(self, key: str) -> tuple[bytes, float] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            if entry[1] <= time.time():
+                self._remove(key)
+                self.stats.misses += 1
+                self.stats.expired += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry
+
+    def set_entry(self, key: str, value: bytes, expires: float) -> None:
+        if len(value) > self.maxbytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, expires)
+            self.size += len(value)
+            self.stats.sets += 1
+            while len(self._entries) > self.maxsize or self.size > self.maxbytes:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+    def purge_expired(self) -> int:
+        """
+        Remove all expired entries, which are otherwise only dropped when looked up or evicted.
+
+        :return: number of removed entries
+        """
+        now = time.time()
+        with self._lock:
+            expired = [key for key, (_, expires) in self._entries.items() if expires <= now]
+            for key in expired:
+                self._remove(key)
+            self.stats.expired += len(expired)
+        return len(expired)
+
+    def _remove(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self.size -= len(value)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(ResponseCache):
+    """
+    On-disk cache backed by SQLite, which can be shared by multiple processes.
+
+    :param path: path to the database file, created if it does not exist
+    :param purge_interval: number of writes after which expired entries are deleted
+    """
+
+    def __init__(self, path: str | Path, purge_interval: int = 1000) -> None:
+        super().__init__()
+        self.purge_interval = purge_interval
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+
+    def get_entry(self, key: str) -> tuple[bytes, float] | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires FROM responses WHERE key = ? AND expires > ?", (key, time.time())
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            return bytes(row[0]), row[1]
+
+    def set_entry(self, key: str, value: bytes, expires: float) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires) VALUES (?, ?, ?)", (key, value, expires)
+            )
+            self.stats.sets += 1
+            if self.stats.sets % self.purge_interval == 0:
+                purged = self._connection.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),))
+                self.stats.expired += purged.rowcount
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class TieredCache(ResponseCache):
+    """
+    Looks up caches in order, e.g. a :py:class:`MemoryCache` in front of a shared :py:class:`SQLiteCache`.
+    Hits of a lower tier are promoted to the tiers above it, writes go to all tiers.
+    The counters of this cache are end to end, every tier keeps its own as well.
+    """
+
+    def __init__(self, *tiers: ResponseCache) -> None:
+        super().__init__()
+        self.tiers = tiers
+
+    def get_entry(self, key: str) -> tuple[bytes, float] | None:
+        for i, tier in enumerate(self.tiers):
+            entry = tier.get_entry(key)
+            if entry is not None:
+                for upper in self.tiers[:i]:
+                    upper.set_entry(key, *entry)
+                self.stats.hits += 1
+                return entry
+        self.stats.misses += 1
+        return None
+
+    def set_entry(self, key: str, value: bytes, expires: float) -> None:
+        self.stats.sets += 1
+        for tier in self.tiers:
+            tier.set_entry(key, value, expires)
@@ -1,7 +1,8 @@
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, Future
+from typing import Any, Generic, TypeVar
 
-from ytmusicapi.navigation import nav
+from ytmusicapi.navigation import NavPath, nav
 from ytmusicapi.type_alias import (
     JsonDict,
     JsonList,
@@ -11,8 +12,58 @@ from ytmusicapi.type_alias import (
     RequestFuncType,
 )
 
-CONTINUATION_TOKEN = ["continuationItemRenderer", "continuationEndpoint", "continuationCommand", "token"]
-CONTINUATION_ITEMS = ["onResponseReceivedActions", 0, "appendContinuationItemsAction", "continuationItems"]
+CONTINUATION_TOKEN = NavPath("continuationItemRenderer", "continuationEndpoint", "continuationCommand", "token")
+CONTINUATION_ITEMS = NavPath("onResponseReceivedActions", 0, "appendContinuationItemsAction", "continuationItems")
+
+P = TypeVar("P")
+
+
+class PagePrefetcher(Generic[P]):
+    """
+    Requests the next continuation page on an executor while the current page is parsed.
+
+    Every continuation token is only known from the response to the previous page,
+    so at most one page per chain is requested ahead. The number of pages in flight across
+    all chains of a :py:class:`YTMusic` instance is bounded by the size of its executor.
+    A chain never waits for a free executor thread, a page whose prefetch has not started yet
+    when it is needed is requested directly.
+
+    :param request_func: the request func to use to get the continuations
+    :param executor: executor to run prefetch requests on. None to request every page when it is needed
+    """
+
+    def __init__(self, request_func: Callable[[P], JsonDict], executor: Executor | None) -> None:
+        self.request_func = request_func
+        self.executor = executor
+        self._pending: tuple[P, Future[JsonDict]] | None = None
+
+    def prefetch(self, params: P) -> None:
+        """Start requesting the page for ``params`` in the background"""
+        if self.executor is not None:
+            self._pending = (params, self.executor.submit(self.request_func, params))
+
+    def get(self, params: P) -> JsonDict:
+        """:return: the page for ``params``, awaiting the prefetch request if one was started"""
+        pending, self._pending = self._pending, None
+        # a prefetch still queued behind those of other chains is not waited for, the page is requested here
+        if pending is not None and pending[0] == params and not pending[1].cancel():
+            return pending[1].result()
+        return self.request_func(params)
+
+    def cancel(self) -> None:
+        """Discard a prefetch request that is no longer needed"""
+        if self._pending is not None:
+            self._pending[1].cancel()
+            self._pending = None
+
+
+def may_need_next_page(count: int, page_size: int, limit: int | None) -> bool:
+    """
+    :param count: number of items parsed so far
+    :param page_size: number of raw items on the current page, which bounds the number of parsed items
+    :return: False if the current page already satisfies the limit for certain
+    """
+    return page_size > 0 and (limit is None or count + page_size < limit)
 
 
 def get_continuation_token(results: JsonList) -> str | None:
@@ -24,22 +75,42 @@ def get_continuations_2025(
     limit: int | None,
     request_func: RequestFuncBodyType,
     parse_func: ParseFuncType,
+    prefetch: Executor | None = None,
 ) -> JsonList:
-    items: JsonList = []
-    continuation_token = get_continuation_token(results["contents"])
-    while continuation_token and (limit is None or len(items) < limit):
-        response = request_func({"continuation": continuation_token})
-        continuation_items = nav(response, CONTINUATION_ITEMS, True)
-        if not continuation_items:
-            break
+    pages = iter_continuations_2025(results, limit, request_func, parse_func, prefetch)
+    return [item for page in pages for item in page]
 
-        contents = parse_func(continuation_items)
-        if len(contents) == 0:
-            break
-        items.extend(contents)
-        continuation_token = get_continuation_token(continuation_items)
 
-    return items
+def iter_continuations_2025(
+    results: JsonDict,
+    limit: int | None,
+    request_func: RequestFuncBodyType,
+    parse_func: ParseFuncType,
+    prefetch: Executor | None = None,
+) -> Iterator[JsonList]:
+    """Generator variant of :py:func:`get_continuations_2025`, which yields the parsed items page by page"""
+    count = 0
+    pages = PagePrefetcher(request_func, prefetch)
+    try:
+        continuation_token = get_continuation_token(results["contents"])
+        while continuation_token and (limit is None or count < limit):
+            response = pages.get({"continuation": continuation_token})
+            continuation_items = nav(response, CONTINUATION_ITEMS, True)
+            if not continuation_items:
+                break
+
+            continuation_token = get_continuation_token(continuation_items)
+            # the last item is the continuation itself
+            if continuation_token and may_need_next_page(count, len(continuation_items) - 1, limit):
+                pages.prefetch({"continuation": continuation_token})
+
+            contents = parse_func(continuation_items)
+            if len(contents) == 0:
+                break
+            count += len(contents)
+            yield contents
+    finally:
+        pages.cancel()
 
 
 def get_reloadable_continuations(
@@ -48,11 +119,18 @@ def get_reloadable_continuations(
     limit: int | None,
     request_func: RequestFuncType,
     parse_func: ParseFuncType,
+    prefetch: Executor | None = None,
 ) -> JsonList:
     """Reloadable continuations are a special case that only exists on the playlists page (suggestions)."""
     additionalParams = get_reloadable_continuation_params(results)
     return get_continuations(
-        results, continuation_type, limit, request_func, parse_func, additionalParams=additionalParams
+        results,
+        continuation_type,
+        limit,
+        request_func,
+        parse_func,
+        additionalParams=additionalParams,
+        prefetch=prefetch,
     )
 
 
@@ -64,6 +142,7 @@ def get_continuations(
     parse_func: ParseFuncType,
     ctoken_path: str = "",
     additionalParams: str | None = None,
+    prefetch: Executor | None = None,
 ) -> JsonList:
     """
 
@@ -77,22 +156,49 @@ def get_continuations(
     :param ctoken_path: rarely used specifier applied to retrieve the ctoken ("next<ctoken_path>ContinuationData").
             Default empty string
     :param additionalParams: Optional additional params to pass to the request func. Default: use get_continuation_params
+    :param prefetch: Optional executor to request the next page on while the current one is parsed.
+            Default: request every page when it is needed
     :return: list of parsed continuation results
     """
-    items: JsonList = []
-    while "continuations" in results and (limit is None or len(items) < limit):
-        additional_params = additionalParams or get_continuation_params(results, ctoken_path)
-        response = request_func(additional_params)
-        if "continuationContents" in response:
-            results = response["continuationContents"][continuation_type]
-        else:
-            break
-        contents = get_continuation_contents(results, parse_func)
-        if len(contents) == 0:
-            break
-        items.extend(contents)
-
-    return items
+    pages = iter_continuations(
+        results, continuation_type, limit, request_func, parse_func, ctoken_path, additionalParams, prefetch
+    )
+    return [item for page in pages for item in page]
+
+
+def iter_continuations(
+    results: JsonDict,
+    continuation_type: str,
+    limit: int | None,
+    request_func: RequestFuncType,
+    parse_func: ParseFuncType,
+    ctoken_path: str = "",
+    additionalParams: str | None = None,
+    prefetch: Executor | None = None,
+) -> Iterator[JsonList]:
+    """
+    Generator variant of :py:func:`get_continuations`, which yields the parsed items page by page.
+    The next page is only requested once the consumer asks for it, or prefetched if an executor is given.
+    """
+    count = 0
+    pages = PagePrefetcher(request_func, prefetch)
+    try:
+        while "continuations" in results and (limit is None or count < limit):
+            additional_params = additionalParams or get_continuation_params(results, ctoken_path)
+            response = pages.get(additional_params)
+            if "continuationContents" in response:
+                results = response["continuationContents"][continuation_type]
+            else:
+                break
+            if "continuations" in results and may_need_next_page(count, get_continuation_size(results), limit):
+                pages.prefetch(additionalParams or get_continuation_params(results, ctoken_path))
+            contents = get_continuation_contents(results, parse_func)
+            if len(contents) == 0:
+                break
+            count += len(contents)
+            yield contents
+    finally:
+        pages.cancel()
 
 
 def get_validated_continuations(
@@ -103,22 +209,46 @@ def get_validated_continuations(
     request_func: RequestFuncType,
     parse_func: ParseFuncType,
     ctoken_path: str = "",
+    prefetch: Executor | None = None,
 ) -> JsonList:
-    items: JsonList = []
-    while "continuations" in results and len(items) < limit:
-        additionalParams = get_continuation_params(results, ctoken_path)
-        wrapped_parse_func = lambda raw_response: get_parsed_continuation_items(
-            raw_response, parse_func, continuation_type
-        )
-        validate_func = lambda parsed: validate_response(parsed, per_page, limit, len(items))
+    pages = iter_validated_continuations(
+        results, continuation_type, limit, per_page, request_func, parse_func, ctoken_path, prefetch
+    )
+    return [item for page in pages for item in page]
 
-        response = resend_request_until_parsed_response_is_valid(
-            request_func, additionalParams, wrapped_parse_func, validate_func, 3
-        )
-        results = response["results"]
-        items.extend(response["parsed"])
 
-    return items
+def iter_validated_continuations(
+    results: JsonDict,
+    continuation_type: str,
+    limit: int,
+    per_page: int,
+    request_func: RequestFuncType,
+    parse_func: ParseFuncType,
+    ctoken_path: str = "",
+    prefetch: Executor | None = None,
+) -> Iterator[JsonList]:
+    """Generator variant of :py:func:`get_validated_continuations`, which yields the parsed items page by page"""
+    count = 0
+    pages = PagePrefetcher(request_func, prefetch)
+    wrapped_parse_func = lambda raw_response: get_parsed_continuation_items(
+        raw_response, parse_func, continuation_type
+    )
+    try:
+        while "continuations" in results and count < limit:
+            additionalParams = get_continuation_params(results, ctoken_path)
+            validate_func = lambda parsed: validate_response(parsed, per_page, limit, count)
+
+            response = resend_request_until_parsed_response_is_valid(
+                request_func, additionalParams, wrapped_parse_func, validate_func, 3, pages.get
+            )
+            results = response["results"]
+            # the first attempt for the next page only, retries depend on the validation of this one
+            if "continuations" in results and may_need_next_page(count, get_continuation_size(results), limit):
+                pages.prefetch(get_continuation_params(results, ctoken_path))
+            count += len(response["parsed"])
+            yield response["parsed"]
+    finally:
+        pages.cancel()
 
 
 def get_parsed_continuation_items(
@@ -147,6 +277,15 @@ def get_continuation_string(ctoken: str) -> str:
     return "&ctoken=" + ctoken + "&continuation=" + ctoken
 
 
+def get_continuation_size(continuation: JsonDict) -> int:
+    """:return: number of raw items in the continuation"""
+    for term in ["contents", "items"]:
+        if term in continuation:
+            return len(continuation[term])
+
+    return 0
+
+
 def get_continuation_contents(continuation: JsonDict, parse_func: ParseFuncType) -> JsonList:
     for term in ["contents", "items"]:
         if term in continuation:
@@ -161,8 +300,9 @@ def resend_request_until_parsed_response_is_valid(
     parse_func: ParseFuncDictType,
     validate_func: Callable[[dict[str, Any]], bool],
     max_retries: int,
+    first_request_func: RequestFuncType | None = None,
 ) -> JsonDict:
-    response = request_func(request_additional_params)
+    response = (first_request_func or request_func)(request_additional_params)
     parsed_object = parse_func(response)
     retry_counter = 0
     while not validate_func(parsed_object) and retry_counter < max_retries:
@@ -1,5 +1,4 @@
 import json
-import locale
 import re
 import time
 import unicodedata
@@ -69,7 +68,7 @@ def get_authorization(auth: str) -> str:
 
 
 def to_int(string: str) -> int:
-    """Attempts to cast a string to an integer using locale or Python int cast
+    """Attempts to cast a string to an integer, ignoring any grouping separators
 
     :param string: string that can be cast to an integer
 
@@ -78,13 +77,8 @@ def to_int(string: str) -> int:
     :raise ValueError if string is not a valid integer
     """
     string = unicodedata.normalize("NFKD", string)
-    number_string = re.sub(r"\D", "", string)
-    try:
-        int_value = locale.atoi(number_string)
-    except ValueError:
-        number_string = number_string.replace(",", "")
-        int_value = int(number_string)
-    return int_value
+    # only digits remain, which parse the same in every locale
+    return int(re.sub(r"\D", "", string))
 
 
 def sum_total_duration(item: JsonDict) -> int:
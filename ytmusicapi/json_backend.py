@@ -0,0 +1,96 @@
+"""
+JSON backend for decoding responses and encoding results.
+
+orjson or msgspec are used if installed, otherwise the standard library. All of them decode
+the raw response bytes directly, without materializing an intermediate ``str``.
+The backend is chosen on import, the environment variable ``YTMUSICAPI_JSON`` may force
+one of ``orjson``, ``msgspec`` or ``json``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable, Collection
+from typing import Any
+
+from ytmusicapi.exceptions import YTMusicUserError
+
+#: supported backends, in order of preference
+BACKENDS = ("orjson", "msgspec", "json")
+
+#: name of the backend in use
+backend = "json"
+_loads: Callable[[bytes | str], Any] = json.loads
+#: encodes to compact UTF-8 bytes
+dumps: Callable[[Any], bytes]
+
+
+def loads(data: bytes | str) -> Any:
+    """Decodes UTF-8 bytes or a str"""
+    return _loads(data)
+
+
+def select_fields(document: dict[str, Any], fields: Collection[str]) -> dict[str, Any]:
+    """
+    Copies only the given subtrees of a decoded document, everything else is released with it.
+
+    :param fields: dotted paths of object keys, e.g. ``frameworkUpdates.entityBatchUpdate.mutations``.
+        Paths missing from the document are skipped.
+    :return: a new document with the same nesting
+    """
+    selected: dict[str, Any] = {}
+    for field in fields:
+        *parents, leaf = field.split(".")
+        source: Any = document
+        for key in parents:
+            source = source.get(key) if isinstance(source, dict) else None
+        if not isinstance(source, dict) or leaf not in source:
+            continue
+        target = selected
+        for key in parents:
+            target = target.setdefault(key, {})
+        target[leaf] = source[leaf]
+    return selected
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def set_backend(name: str) -> None:
+    """
+    Switch the backend for all subsequent calls.
+
+    :param name: one of :py:data:`BACKENDS`
+    :raises ImportError: if the backend is not installed
+    """
+    global backend, _loads, dumps
+    if name == "orjson":
+        import orjson
+
+        _loads, dumps = orjson.loads, orjson.dumps
+    elif name == "msgspec":
+        import msgspec
+
+        _loads, dumps = msgspec.json.decode, msgspec.json.encode
+    elif name == "json":
+        _loads, dumps = json.loads, _json_dumps
+    else:
+        raise YTMusicUserError(f"Unknown JSON backend {name!r}, expected one of {', '.join(BACKENDS)}")
+    backend = name
+
+
+def _select_backend() -> None:
+    if requested := os.getenv("YTMUSICAPI_JSON"):
+        set_backend(requested)
+        return
+    for name in BACKENDS:
+        try:
+            set_backend(name)
+            return
+        except ImportError:
+            continue
+
+
+_select_backend()
@@ -1,6 +1,7 @@
 """protocol that defines the functions available to mixins"""
 
-from collections.abc import Iterator
+from collections.abc import Collection, Iterator
+from concurrent.futures import Executor
 from contextlib import contextmanager
 from typing import Protocol
 
@@ -21,11 +22,15 @@ class MixinProtocol(Protocol):
 
     proxies: dict[str, str] | None
 
+    _continuation_executor: Executor | None
+
     def _check_auth(self) -> None:
         """checks if self has authentication"""
 
-    def _send_request(self, endpoint: str, body: JsonDict, additionalParams: str = "") -> JsonDict:
-        """for sending post requests to YouTube Music"""
+    def _send_request(
+        self, endpoint: str, body: JsonDict, additionalParams: str = "", fields: Collection[str] | None = None
+    ) -> JsonDict:
+        """for sending post requests to YouTube Music, optionally reduced to the given subtrees"""
 
     def _send_get_request(self, url: str, params: JsonDict | None = None) -> Response:
         """for sending get requests to YouTube Music"""
@@ -1,10 +1,13 @@
 import re
 import warnings
+from collections.abc import Collection, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Literal, overload
 
 from ytmusicapi.continuations import (
     get_continuations,
     get_reloadable_continuation_params,
+    iter_continuations,
 )
 from ytmusicapi.helpers import YTM_DOMAIN, sum_total_duration
 from ytmusicapi.models.lyrics import LyricLine, Lyrics, TimedLyrics
@@ -26,6 +29,10 @@ from ._protocol import MixinProtocol
 from ._utils import get_datestamp
 
 
+#: keys of the player response returned by :py:meth:`BrowsingMixin.get_song` by default
+SONG_FIELDS = ("videoDetails", "playabilityStatus", "streamingData", "microformat", "playbackTracking")
+
+
 class BrowsingMixin(MixinProtocol):
     def get_home(self, limit: int = 3) -> JsonList:
         """
@@ -114,7 +121,7 @@ class BrowsingMixin(MixinProtocol):
         """
         endpoint = "browse"
         body = {"browseId": "FEmusic_home"}
-        response = self._send_request(endpoint, body)
+        response = self._send_request(endpoint, body, fields=("contents",))
         results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST)
         home = parse_mixed_content(results)
 
@@ -131,6 +138,7 @@ class BrowsingMixin(MixinProtocol):
                     limit - len(home),
                     request_func,
                     parse_mixed_content,
+                    prefetch=self._continuation_executor,
                 )
             )
 
@@ -249,7 +257,7 @@ class BrowsingMixin(MixinProtocol):
             channelId = channelId[4:]
         body = {"browseId": channelId}
         endpoint = "browse"
-        response = self._send_request(endpoint, body)
+        response = self._send_request(endpoint, body, fields=("contents", "header"))
         results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST)
 
         artist: JsonDict = {"description": None, "views": None}
@@ -301,6 +309,16 @@ class BrowsingMixin(MixinProtocol):
         :return: List of albums in the format of :py:func:`get_library_albums`,
           except artists key is missing.
 
+        """
+        return list(self.iter_artist_albums(channelId, params, limit, order))
+
+    def iter_artist_albums(
+        self, channelId: str, params: str, limit: int | None = 100, order: ArtistOrderType | None = None
+    ) -> Iterator[JsonDict]:
+        """
+        Generator variant of :py:func:`get_artist_albums`, which yields the albums one by one
+        and requests the next page only when the previous one has been consumed.
+        Takes the same arguments as :py:func:`get_artist_albums`.
         """
         body = {"browseId": channelId, "params": params}
         endpoint = "browse"
@@ -361,15 +379,20 @@ class BrowsingMixin(MixinProtocol):
 
         contents = nav(results, GRID_ITEMS, True) or nav(results, CAROUSEL_CONTENTS)
         albums = parse_albums(contents)
+        yield from albums
 
         results = nav(results, GRID, True)  # type: ignore[assignment]
         if "continuations" in results:
             remaining_limit = None if limit is None else (limit - len(albums))
-            albums.extend(
-                get_continuations(results, "gridContinuation", remaining_limit, request_func, parse_func)
-            )
-
-        return albums
+            for page in iter_continuations(
+                results,
+                "gridContinuation",
+                remaining_limit,
+                request_func,
+                parse_func,
+                prefetch=self._continuation_executor,
+            ):
+                yield from page
 
     def get_user(self, channelId: str) -> JsonDict:
         """
@@ -571,7 +594,7 @@ class BrowsingMixin(MixinProtocol):
 
         body = {"browseId": browseId}
         endpoint = "browse"
-        response = self._send_request(endpoint, body)
+        response = self._send_request(endpoint, body, fields=("contents",))
         album: JsonDict = parse_album_header_2024(response)
 
         results = nav(response, [*TWO_COLUMN_RENDERER, "secondaryContents", *SECTION_LIST_ITEM, *MUSIC_SHELF])
@@ -595,13 +618,18 @@ class BrowsingMixin(MixinProtocol):
 
         return album
 
-    def get_song(self, videoId: str, signatureTimestamp: int | None = None) -> JsonDict:
+    def get_song(
+        self, videoId: str, signatureTimestamp: int | None = None, fields: Collection[str] | None = None
+    ) -> JsonDict:
         """
         Returns metadata and streaming information about a song or video.
 
         :param videoId: Video id
         :param signatureTimestamp: Provide the current YouTube signatureTimestamp.
             If not provided a default value will be used, which might result in invalid streaming URLs
+        :param fields: Optional. Keys of the result to return, e.g. ``["videoDetails"]`` if only the metadata is needed.
+            The other parts of the response, most notably the large ``streamingData``, are released right away
+            instead of being kept alive by the caller. Default: all keys shown below
         :return: Dictionary with song metadata.
 
         Example::
@@ -774,12 +802,40 @@ class BrowsingMixin(MixinProtocol):
             "playbackContext": {"contentPlaybackContext": {"signatureTimestamp": signatureTimestamp}},
             "video_id": videoId,
         }
-        response = self._send_request(endpoint, params)
-        keys = ["videoDetails", "playabilityStatus", "streamingData", "microformat", "playbackTracking"]
-        for k in list(response.keys()):
-            if k not in keys:
-                del response[k]
-        return response
+        return self._send_request(endpoint, params, fields=SONG_FIELDS if fields is None else fields)
+
+    def get_songs(
+        self,
+        videoIds: list[str],
+        signatureTimestamp: int | None = None,
+        max_concurrency: int = 8,
+        fields: Collection[str] | None = None,
+    ) -> list[JsonDict | Exception]:
+        """
+        Returns metadata and streaming information about several songs or videos at once, see :py:meth:`get_song`.
+        Duplicate ids are requested once.
+
+        :param videoIds: Video ids
+        :param signatureTimestamp: Provide the current YouTube signatureTimestamp.
+            If not provided a default value will be used, which might result in invalid streaming URLs
+        :param max_concurrency: Maximum number of requests sent at the same time. Default: 8
+        :param fields: Optional. Keys of each result to return, see :py:meth:`get_song`
+        :return: List with the result of :py:meth:`get_song` for each id, in the order of ``videoIds``.
+            A failed lookup is represented by its exception instead of failing the others.
+        """
+        if not signatureTimestamp:
+            signatureTimestamp = get_datestamp() - 1
+        unique = list(dict.fromkeys(videoIds))
+
+        def get_song(videoId: str) -> JsonDict | Exception:
+            try:
+                return self.get_song(videoId, signatureTimestamp, fields)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max(1, min(max_concurrency, len(unique))), thread_name_prefix="ytmusicapi-songs") as pool:
+            results = dict(zip(unique, pool.map(get_song, unique)))
+        return [results[videoId] for videoId in videoIds]
 
     def get_song_related(self, browseId: str) -> JsonList:
         """
@@ -56,7 +56,9 @@ class ChartsMixin(MixinProtocol):
         if country:
             body["formData"] = {"selectedValues": [country]}
 
-        response = self._send_request("browse", body)
+        response = self._send_request(
+            "browse", body, fields=("contents", "frameworkUpdates.entityBatchUpdate.mutations")
+        )
         results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST)
         charts: JsonDict = {"countries": {}}
         menu = nav(
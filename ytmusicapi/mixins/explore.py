@@ -50,7 +50,7 @@ class ExploreMixin(MixinProtocol):
 
         """
         sections: JsonDict = {}
-        response = self._send_request("browse", {"browseId": "FEmusic_moods_and_genres"})
+        response = self._send_request("browse", {"browseId": "FEmusic_moods_and_genres"}, fields=("contents",))
         for section in nav(response, SINGLE_COLUMN_TAB + SECTION_LIST):
             title = nav(section, [*GRID, "header", "gridHeaderRenderer", *TITLE_TEXT])
             sections[title] = []
@@ -71,7 +71,7 @@ class ExploreMixin(MixinProtocol):
         """
         playlists = []
         response = self._send_request(
-            "browse", {"browseId": "FEmusic_moods_and_genres_category", "params": params}
+            "browse", {"browseId": "FEmusic_moods_and_genres_category", "params": params}, fields=("contents",)
         )
         for section in nav(response, SINGLE_COLUMN_TAB + SECTION_LIST):
             path = []
@@ -217,7 +217,7 @@ class ExploreMixin(MixinProtocol):
         """
         body: JsonDict = {"browseId": "FEmusic_explore"}
 
-        response = self._send_request("browse", body)
+        response = self._send_request("browse", body, fields=("contents",))
         results = nav(response, SINGLE_COLUMN_TAB + SECTION_LIST)
 
         explore: JsonDict = {}
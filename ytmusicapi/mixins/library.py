@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from random import randint
 
 from requests import Response
@@ -50,7 +50,14 @@ class LibraryMixin(MixinProtocol):
             parse_func: ParseFuncType = lambda contents: parse_content_list(contents, parse_playlist)
             remaining_limit = None if limit is None else (limit - len(playlists))
             playlists.extend(
-                get_continuations(results, "gridContinuation", remaining_limit, request_func, parse_func)
+                get_continuations(
+                    results,
+                    "gridContinuation",
+                    remaining_limit,
+                    request_func,
+                    parse_func,
+                    prefetch=self._continuation_executor,
+                )
             )
 
         return playlists
@@ -68,6 +75,16 @@ class LibraryMixin(MixinProtocol):
         :param order: Order of songs to return. Allowed values: ``a_to_z``, ``z_to_a``, ``recently_added``. Default: Default order.
         :return: List of songs. Same format as :py:func:`get_playlist`
         """
+        return list(self.iter_library_songs(limit, validate_responses, order))
+
+    def iter_library_songs(
+        self, limit: int = 25, validate_responses: bool = False, order: LibraryOrderType | None = None
+    ) -> Iterator[JsonDict]:
+        """
+        Generator variant of :py:func:`get_library_songs`, which yields the songs one by one
+        and requests the next page only when the previous one has been consumed.
+        Takes the same arguments as :py:func:`get_library_songs`.
+        """
         self._check_auth()
         body = {"browseId": "FEmusic_liked_videos"}
         validate_order_parameter(order)
@@ -95,8 +112,10 @@ class LibraryMixin(MixinProtocol):
         results = response["results"]
         songs: JsonList | None = response["parsed"]
         if songs is None:
-            return []
+            return
 
+        yield from songs
+        count = len(songs)
         if "continuations" in results:
             request_continuations_func = lambda additionalParams: self._send_request(
                 endpoint, body, additionalParams
@@ -104,29 +123,27 @@ class LibraryMixin(MixinProtocol):
             parse_continuations_func = lambda contents: parse_playlist_items(contents)
 
             if validate_responses:
-                songs.extend(
-                    get_validated_continuations(
-                        results,
-                        "musicShelfContinuation",
-                        limit - len(songs),
-                        per_page,
-                        request_continuations_func,
-                        parse_continuations_func,
-                    )
+                pages = iter_validated_continuations(
+                    results,
+                    "musicShelfContinuation",
+                    limit - count,
+                    per_page,
+                    request_continuations_func,
+                    parse_continuations_func,
+                    prefetch=self._continuation_executor,
                 )
             else:
-                remaining_limit = None if limit is None else (limit - len(songs))
-                songs.extend(
-                    get_continuations(
-                        results,
-                        "musicShelfContinuation",
-                        remaining_limit,
-                        request_continuations_func,
-                        parse_continuations_func,
-                    )
+                remaining_limit = None if limit is None else (limit - count)
+                pages = iter_continuations(
+                    results,
+                    "musicShelfContinuation",
+                    remaining_limit,
+                    request_continuations_func,
+                    parse_continuations_func,
+                    prefetch=self._continuation_executor,
                 )
-
-        return songs
+            for page in pages:
+                yield from page
 
     def get_library_albums(self, limit: int = 25, order: LibraryOrderType | None = None) -> JsonList:
         """
@@ -1,6 +1,9 @@
+from collections.abc import Iterator
+
 from ytmusicapi.continuations import *
 from ytmusicapi.exceptions import YTMusicUserError
 from ytmusicapi.helpers import sum_total_duration
+from ytmusicapi.models.tracks import Track
 from ytmusicapi.navigation import *
 from ytmusicapi.parsers.browsing import parse_content_list, parse_playlist
 from ytmusicapi.parsers.playlists import *
@@ -12,7 +15,12 @@ from ._utils import *
 
 class PlaylistsMixin(MixinProtocol):
     def get_playlist(
-        self, playlistId: str, limit: int | None = 100, related: bool = False, suggestions_limit: int = 0
+        self,
+        playlistId: str,
+        limit: int | None = 100,
+        related: bool = False,
+        suggestions_limit: int = 0,
+        as_models: bool = False,
     ) -> JsonDict:
         """
         Returns a list of playlist items
@@ -23,6 +31,8 @@ class PlaylistsMixin(MixinProtocol):
         :param suggestions_limit: How many suggestions to return. The result is a list of
             suggested playlist items (videos) contained in a "suggestions" key.
             7 items are retrieved in each internal request. Default: 0
+        :param as_models: Return the ``tracks`` as :py:class:`ytmusicapi.models.Track` instances instead of
+            dictionaries, which need considerably less memory for large playlists. Default: False
         :return: Dictionary with information about the playlist.
             The key ``tracks`` contains a List of playlistItem dictionaries
 
@@ -129,17 +139,71 @@ class PlaylistsMixin(MixinProtocol):
                 }
             }
         """
+        playlist, pages = self._get_playlist(playlistId, limit, related, suggestions_limit, as_models)
+        playlist["tracks"] = [track for page in pages for track in page]
+        if as_models:
+            if "title" not in playlist and playlist["tracks"]:
+                playlist["title"] = playlist["tracks"][0].album.name
+            playlist["duration_seconds"] = sum(track.duration_seconds or 0 for track in playlist["tracks"])
+            return playlist
+
+        if "title" not in playlist and playlist["tracks"]:
+            # audio playlists have no header, their title is the album name
+            playlist["title"] = playlist["tracks"][0]["album"]["name"]
+
+        playlist["duration_seconds"] = sum_total_duration(playlist)
+        return playlist
+
+    def iter_playlist(
+        self, playlistId: str, limit: int | None = 100, as_models: bool = False
+    ) -> Iterator[JsonDict | Track]:
+        """
+        Generator variant of :py:func:`get_playlist`, which yields the playlist items one by one.
+        Every page of items is yielded before the next page is requested (or prefetched),
+        so memory use does not grow with the size of the playlist::
+
+            for track in ytmusic.iter_playlist(playlistId, limit=None):
+                print(track["title"])
+
+        :param playlistId: Playlist id
+        :param limit: How many songs to return. ``None`` retrieves them all. Default: 100
+        :param as_models: Yield :py:class:`ytmusicapi.models.Track` instances instead of dictionaries. Default: False
+        :return: Iterator of playlistItem dictionaries in the format of :py:func:`get_playlist`
+        """
+        _, pages = self._get_playlist(playlistId, limit, as_models=as_models)
+        for page in pages:
+            yield from page
+
+    def _get_playlist(
+        self,
+        playlistId: str,
+        limit: int | None,
+        related: bool = False,
+        suggestions_limit: int = 0,
+        as_models: bool = False,
+    ) -> tuple[JsonDict, Iterator[JsonList]]:
+        """
+        :return: the playlist without tracks, and an iterator of the pages of its tracks.
+            The first page is parsed from the initial response, the others are requested lazily.
+        """
         browseId = "VL" + playlistId if not playlistId.startswith("VL") else playlistId
         body = {"browseId": browseId}
         endpoint = "browse"
         request_func: RequestFuncType = lambda additionalParams: self._send_request(
             endpoint, body, additionalParams
         )
-        response = request_func("")
+        response = self._send_request(endpoint, body, fields=("contents", "header"))
 
         request_func_continuations: RequestFuncBodyType = lambda body: self._send_request(endpoint, body)
         if playlistId.startswith("OLA") or playlistId.startswith("VLOLA"):
-            return parse_audio_playlist(response, limit, request_func_continuations)
+            playlist, content_data = parse_audio_playlist_header(response)
+            return playlist, iter_playlist_shelf(
+                content_data,
+                limit,
+                request_func_continuations,
+                prefetch=self._continuation_executor,
+                as_models=as_models,
+            )
 
         header_data = nav(response, [*TWO_COLUMN_RENDERER, *TAB_CONTENT, *SECTION_LIST_ITEM])
         section_list = nav(response, [*TWO_COLUMN_RENDERER, "secondaryContents", *SECTION])
@@ -192,6 +256,7 @@ class PlaylistsMixin(MixinProtocol):
                         suggestions_limit - len(playlist["suggestions"]),
                         request_func,
                         parse_func,
+                        prefetch=self._continuation_executor,
                     )
                 )
 
@@ -206,18 +271,14 @@ class PlaylistsMixin(MixinProtocol):
 
         playlist["tracks"] = []
         content_data = nav(section_list, [*CONTENT, "musicPlaylistShelfRenderer"])
-        if "contents" in content_data:
-            playlist["tracks"] = parse_playlist_items(
-                content_data["contents"], is_collaborative=is_collaborative
-            )
-
-            parse_func = lambda contents: parse_playlist_items(contents, is_collaborative=is_collaborative)
-            playlist["tracks"].extend(
-                get_continuations_2025(content_data, limit, request_func_continuations, parse_func)
-            )
-
-        playlist["duration_seconds"] = sum_total_duration(playlist)
-        return playlist
+        return playlist, iter_playlist_shelf(
+            content_data,
+            limit,
+            request_func_continuations,
+            is_collaborative=is_collaborative,
+            prefetch=self._continuation_executor,
+            as_models=as_models,
+        )
 
     def get_liked_songs(self, limit: int = 100) -> JsonDict:
         """
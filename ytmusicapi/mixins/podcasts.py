@@ -1,3 +1,6 @@
+import itertools
+from collections.abc import Iterator
+
 from ytmusicapi.continuations import *
 from ytmusicapi.mixins._protocol import MixinProtocol
 from ytmusicapi.navigation import *
@@ -133,6 +136,29 @@ class PodcastsMixin(MixinProtocol):
                 ]
             }
         """
+        podcast, pages = self._get_podcast(playlistId, limit)
+        podcast["episodes"] = [episode for page in pages for episode in page]
+
+        return podcast
+
+    def iter_podcast(self, playlistId: str, limit: int | None = 100) -> Iterator[JsonDict]:
+        """
+        Generator variant of :py:func:`get_podcast`, which yields the episodes one by one
+        and requests the next page only when the previous one has been consumed.
+
+        :param playlistId: Playlist id
+        :param limit: How many episodes to return. ``None`` retrieves them all. Default: 100
+        :return: Iterator of episodes in the format of :py:func:`get_podcast`
+        """
+        _, pages = self._get_podcast(playlistId, limit)
+        for page in pages:
+            yield from page
+
+    def _get_podcast(self, playlistId: str, limit: int | None) -> tuple[JsonDict, Iterator[JsonList]]:
+        """
+        :return: the podcast without episodes, and an iterator of the pages of its episodes.
+            The first page is parsed from the initial response, the others are requested lazily.
+        """
         browseId = "MPSP" + playlistId if not playlistId.startswith("MPSP") else playlistId
         body = {"browseId": browseId}
         endpoint = "browse"
@@ -144,21 +170,22 @@ class PodcastsMixin(MixinProtocol):
         results = nav(two_columns, ["secondaryContents", *SECTION_LIST_ITEM, *MUSIC_SHELF])
         parse_func: ParseFuncType = lambda contents: parse_content_list(contents, parse_episode, MMRIR)
         episodes = parse_func(results["contents"])
+        if "continuations" not in results:
+            return podcast, iter([episodes])
 
-        if "continuations" in results:
-            request_func: RequestFuncType = lambda additionalParams: self._send_request(
-                endpoint, body, additionalParams
-            )
-            remaining_limit = None if limit is None else (limit - len(episodes))
-            episodes.extend(
-                get_continuations(
-                    results, "musicShelfContinuation", remaining_limit, request_func, parse_func
-                )
-            )
-
-        podcast["episodes"] = episodes
-
-        return podcast
+        request_func: RequestFuncType = lambda additionalParams: self._send_request(
+            endpoint, body, additionalParams
+        )
+        remaining_limit = None if limit is None else (limit - len(episodes))
+        continuations = iter_continuations(
+            results,
+            "musicShelfContinuation",
+            remaining_limit,
+            request_func,
+            parse_func,
+            prefetch=self._continuation_executor,
+        )
+        return podcast, itertools.chain([episodes], continuations)
 
     def get_episode(self, videoId: str) -> JsonDict:
         """
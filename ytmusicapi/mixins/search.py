@@ -1,8 +1,10 @@
-from ytmusicapi.continuations import get_continuations
+from collections.abc import Iterator
+
+from ytmusicapi.continuations import iter_continuations
 from ytmusicapi.exceptions import YTMusicUserError
 from ytmusicapi.mixins._protocol import MixinProtocol
 from ytmusicapi.parsers.search import *
-from ytmusicapi.type_alias import JsonList, ParseFuncType, RequestFuncType
+from ytmusicapi.type_alias import JsonDict, JsonList, ParseFuncType, RequestFuncType
 
 
 class SearchMixin(MixinProtocol):
@@ -139,10 +141,25 @@ class SearchMixin(MixinProtocol):
             ]
 
 
+        """
+        return list(self.iter_search(query, filter, scope, limit, ignore_spelling))
+
+    def iter_search(
+        self,
+        query: str,
+        filter: str | None = None,
+        scope: str | None = None,
+        limit: int = 20,
+        ignore_spelling: bool = False,
+    ) -> Iterator[JsonDict]:
+        """
+        Generator variant of :py:func:`search`, which yields the results one by one.
+        With a filter, the next page of results is requested only when the previous one has been consumed.
+        Takes the same arguments as :py:func:`search`.
         """
         body = {"query": query}
         endpoint = "search"
-        search_results: JsonList = []
+        count = 0
         filters = [
             "albums",
             "artists",
@@ -185,11 +202,11 @@ class SearchMixin(MixinProtocol):
         if params:
             body["params"] = params
 
-        response = self._send_request(endpoint, body)
+        response = self._send_request(endpoint, body, fields=("contents",))
 
         # no results
         if "contents" not in response:
-            return search_results
+            return
 
         if "tabbedSearchResultsRenderer" in response["contents"]:
             tab_index = 0 if not scope or filter else scopes.index(scope) + 1
@@ -203,7 +220,7 @@ class SearchMixin(MixinProtocol):
 
         # no results
         if len(section_list) == 1 and "itemSectionRenderer" in section_list:
-            return search_results
+            return
 
         # set filter for parser
         result_type = None
@@ -220,7 +237,8 @@ class SearchMixin(MixinProtocol):
                 top_result = parse_top_result(
                     res["musicCardShelfRenderer"], self.parser.get_search_result_types()
                 )
-                search_results.append(top_result)
+                yield top_result
+                count += 1
                 if not (shelf_contents := nav(res, ["musicCardShelfRenderer", "contents"], True)):
                     continue
                 # if "more from youtube" is present, remove it - it's not parseable
@@ -240,7 +258,9 @@ class SearchMixin(MixinProtocol):
             else:
                 continue
 
-            search_results.extend(parse_search_results(shelf_contents, result_type, category))
+            shelf_results = parse_search_results(shelf_contents, result_type, category)
+            yield from shelf_results
+            count += len(shelf_results)
 
             if filter:  # if filter is set, there are continuations
                 request_func: RequestFuncType = lambda additionalParams: self._send_request(
@@ -250,17 +270,16 @@ class SearchMixin(MixinProtocol):
                     contents, result_type, category
                 )
 
-                search_results.extend(
-                    get_continuations(
-                        res["musicShelfRenderer"],
-                        "musicShelfContinuation",
-                        limit - len(search_results),
-                        request_func,
-                        parse_func,
-                    )
-                )
-
-        return search_results
+                for page in iter_continuations(
+                    res["musicShelfRenderer"],
+                    "musicShelfContinuation",
+                    limit - count,
+                    request_func,
+                    parse_func,
+                    prefetch=self._continuation_executor,
+                ):
+                    yield from page
+                    count += len(page)
 
     def get_search_suggestions(self, query: str, detailed_runs: bool = False) -> list[str] | JsonList:
         """
@@ -1,9 +1,10 @@
 import typing
+from collections.abc import Iterator
 from pathlib import Path
 
 import requests
 
-from ytmusicapi.continuations import get_continuations
+from ytmusicapi.continuations import get_continuations, iter_continuations
 from ytmusicapi.helpers import *
 from ytmusicapi.navigation import *
 from ytmusicapi.parsers.albums import parse_album_header
@@ -49,6 +50,16 @@ class UploadsMixin(MixinProtocol):
               "thumbnails": [...]
             }
         """
+        return list(self.iter_library_upload_songs(limit, order))
+
+    def iter_library_upload_songs(
+        self, limit: int | None = 25, order: LibraryOrderType | None = None
+    ) -> Iterator[JsonDict]:
+        """
+        Generator variant of :py:func:`get_library_upload_songs`, which yields the songs one by one
+        and requests the next page only when the previous one has been consumed.
+        Takes the same arguments as :py:func:`get_library_upload_songs`.
+        """
         self._check_auth()
         endpoint = "browse"
         body = {"browseId": "FEmusic_library_privately_owned_tracks"}
@@ -58,22 +69,25 @@ class UploadsMixin(MixinProtocol):
         response = self._send_request(endpoint, body)
         results = get_library_contents(response, MUSIC_SHELF)
         if results is None:
-            return []
+            return
         pop_songs_random_mix(results)
         songs: JsonList = parse_uploaded_items(results["contents"])
+        yield from songs
 
         if "continuations" in results:
             request_func: RequestFuncType = lambda additionalParams: self._send_request(
                 endpoint, body, additionalParams
             )
             remaining_limit = None if limit is None else (limit - len(songs))
-            songs.extend(
-                get_continuations(
-                    results, "musicShelfContinuation", remaining_limit, request_func, parse_uploaded_items
-                )
-            )
-
-        return songs
+            for page in iter_continuations(
+                results,
+                "musicShelfContinuation",
+                remaining_limit,
+                request_func,
+                parse_uploaded_items,
+                prefetch=self._continuation_executor,
+            ):
+                yield from page
 
     def get_library_upload_albums(
         self, limit: int | None = 25, order: LibraryOrderType | None = None
@@ -162,7 +176,12 @@ class UploadsMixin(MixinProtocol):
             remaining_limit = None if limit is None else (limit - len(items))
             items.extend(
                 get_continuations(
-                    results, "musicShelfContinuation", remaining_limit, request_func, parse_func
+                    results,
+                    "musicShelfContinuation",
+                    remaining_limit,
+                    request_func,
+                    parse_func,
+                    prefetch=self._continuation_executor,
                 )
             )
 
@@ -138,7 +138,7 @@ class WatchMixin(MixinProtocol):
         if radio:
             body["params"] = "wAEB"
         endpoint = "next"
-        response = self._send_request(endpoint, body)
+        response = self._send_request(endpoint, body, fields=("contents",))
         watchNextRenderer = nav(
             response,
             [
@@ -186,6 +186,7 @@ class WatchMixin(MixinProtocol):
                     request_func,
                     parse_func,
                     "" if is_playlist else "Radio",
+                    prefetch=self._continuation_executor,
                 )
             )
 
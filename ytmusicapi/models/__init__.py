@@ -1,3 +1,4 @@
 from .lyrics import LyricLine, Lyrics, TimedLyrics
+from .tracks import AlbumRef, ArtistRef, Thumbnail, Track
 
-__all__ = ["LyricLine", "Lyrics", "TimedLyrics"]
+__all__ = ["AlbumRef", "ArtistRef", "LyricLine", "Lyrics", "Thumbnail", "TimedLyrics", "Track"]
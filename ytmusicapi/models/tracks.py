@@ -0,0 +1,138 @@
+from dataclasses import dataclass
+
+from ytmusicapi import json_backend
+from ytmusicapi.type_alias import JsonDict
+
+
+@dataclass(slots=True)
+class Thumbnail:
+    """An image in one of the sizes offered by YouTube Music.
+
+    :param url (str): Image url.
+    :param width (int): Width in pixels.
+    :param height (int): Height in pixels.
+    """
+
+    url: str
+    width: int
+    height: int
+
+    @classmethod
+    def from_raw(cls, raw_thumbnail: JsonDict) -> "Thumbnail":
+        return cls(raw_thumbnail["url"], raw_thumbnail.get("width", 0), raw_thumbnail.get("height", 0))
+
+    def to_dict(self) -> JsonDict:
+        return {"url": self.url, "width": self.width, "height": self.height}
+
+
+@dataclass(slots=True)
+class ArtistRef:
+    """An artist credited on a track.
+
+    :param name (str): Artist name.
+    :param id (str | None): Channel id, None for artists without a page.
+    """
+
+    name: str
+    id: str | None
+
+    def to_dict(self) -> JsonDict:
+        return {"name": self.name, "id": self.id}
+
+
+@dataclass(slots=True)
+class AlbumRef:
+    """The album a track belongs to.
+
+    :param name (str): Album title.
+    :param id (str | None): Browse id of the album.
+    """
+
+    name: str
+    id: str | None
+
+    def to_dict(self) -> JsonDict:
+        return {"name": self.name, "id": self.id}
+
+
+@dataclass(slots=True)
+class Track:
+    """A playlist or album item, the typed counterpart of the playlistItem dictionaries.
+
+    Instances take a fraction of the memory of the equivalent dictionary and are not
+    copied when converted, which matters for playlists with thousands of items.
+    The attributes are named like the dictionary keys, see :py:func:`get_playlist`.
+    ``isAlbumTrack`` has no key of its own, it is set for album tracks, which carry a ``trackNumber``.
+    """
+
+    videoId: str | None
+    title: str | None
+    artists: list[ArtistRef] | None
+    album: AlbumRef | None
+    likeStatus: str | None
+    inLibrary: bool | None
+    pinnedToListenAgain: bool | None
+    thumbnails: list[Thumbnail] | None
+    isAvailable: bool
+    isExplicit: bool
+    videoType: str | None
+    views: str | None
+    duration: str | None = None
+    duration_seconds: int | None = None
+    trackNumber: int | None = None
+    isAlbumTrack: bool = False
+    setVideoId: str | None = None
+    feedbackTokens: JsonDict | None = None
+    listenAgainFeedbackTokens: JsonDict | None = None
+
+    @classmethod
+    def from_dict(cls, track: JsonDict) -> "Track":
+        """
+        Converts a playlistItem dictionary, the inverse of :py:meth:`to_dict`.
+
+        :param track: dictionary in the format of the ``tracks`` of :py:func:`get_playlist`
+        """
+        fields = {key: track[key] for key in cls.__dataclass_fields__ if key in track}
+        artists, album, thumbnails = fields.get("artists"), fields.get("album"), fields.get("thumbnails")
+        fields["artists"] = [ArtistRef(artist["name"], artist["id"]) for artist in artists] if artists else artists
+        fields["album"] = AlbumRef(album["name"], album["id"]) if album else None
+        fields["thumbnails"] = [Thumbnail.from_raw(thumbnail) for thumbnail in thumbnails] if thumbnails else thumbnails
+        fields["isAlbumTrack"] = "trackNumber" in track
+        fields.setdefault("isAvailable", True)
+        fields.setdefault("isExplicit", False)
+        for key in ("title", "likeStatus", "inLibrary", "pinnedToListenAgain", "videoType", "views", "videoId"):
+            fields.setdefault(key, None)
+        return cls(**fields)
+
+    def to_dict(self) -> JsonDict:
+        """
+        :return: the playlistItem dictionary returned without models.
+            Optional keys are omitted if they are None, like the parsers do.
+        """
+        track = {
+            "videoId": self.videoId,
+            "title": self.title,
+            "artists": [artist.to_dict() for artist in self.artists] if self.artists is not None else None,
+            "album": self.album.to_dict() if self.album is not None else None,
+            "likeStatus": self.likeStatus,
+            "inLibrary": self.inLibrary,
+            "pinnedToListenAgain": self.pinnedToListenAgain,
+            "thumbnails": [thumbnail.to_dict() for thumbnail in self.thumbnails] if self.thumbnails is not None else None,
+            "isAvailable": self.isAvailable,
+            "isExplicit": self.isExplicit,
+            "videoType": self.videoType,
+            "views": self.views,
+        }
+        if self.isAlbumTrack:
+            # None for unavailable album tracks
+            track["trackNumber"] = self.trackNumber
+        for key in ("feedbackTokens", "listenAgainFeedbackTokens", "setVideoId"):
+            if (value := getattr(self, key)) is not None:
+                track[key] = value
+        if self.duration:
+            track["duration"] = self.duration
+            track["duration_seconds"] = self.duration_seconds
+        return track
+
+    def to_json(self) -> str:
+        return json_backend.dumps(self.to_dict()).decode("utf-8")
@@ -1,97 +1,160 @@
 """commonly used navigation paths"""
 
+from collections.abc import Callable, Sequence
+from functools import lru_cache
 from typing import Any, Literal, overload
 
 from ytmusicapi.type_alias import JsonDict, JsonList
 
-CONTENT = ["contents", 0]
-RUN_TEXT = ["runs", 0, "text"]
-TAB_CONTENT = ["tabs", 0, "tabRenderer", "content"]
-TAB_1_CONTENT = ["tabs", 1, "tabRenderer", "content"]
-TAB_2_CONTENT = ["tabs", 2, "tabRenderer", "content"]
-TWO_COLUMN_RENDERER = ["contents", "twoColumnBrowseResultsRenderer"]
-SINGLE_COLUMN = ["contents", "singleColumnBrowseResultsRenderer"]
-SINGLE_COLUMN_TAB = SINGLE_COLUMN + TAB_CONTENT
-SECTION = ["sectionListRenderer"]
-SECTION_LIST = [*SECTION, "contents"]
-SECTION_LIST_ITEM = SECTION + CONTENT
-RESPONSIVE_HEADER = ["musicResponsiveHeaderRenderer"]
-ITEM_SECTION = ["itemSectionRenderer", *CONTENT]
-MUSIC_SHELF = ["musicShelfRenderer"]
-GRID = ["gridRenderer"]
-GRID_ITEMS = [*GRID, "items"]
-MENU = ["menu", "menuRenderer"]
-MENU_ITEMS = [*MENU, "items"]
-MENU_LIKE_STATUS = [*MENU, "topLevelButtons", 0, "likeButtonRenderer", "likeStatus"]
-MENU_SERVICE = ["menuServiceItemRenderer", "serviceEndpoint"]
+
+def _subscript(keys: tuple[str | int, ...]) -> Callable[[Any], Any]:
+    """a closure subscripting up to four keys in a single expression"""
+    if len(keys) == 1:
+        (a,) = keys
+        return lambda root: root[a]
+    if len(keys) == 2:
+        a, b = keys
+        return lambda root: root[a][b]
+    if len(keys) == 3:
+        a, b, c = keys
+        return lambda root: root[a][b][c]
+    a, b, c, d = keys
+    return lambda root: root[a][b][c][d]
+
+
+@lru_cache(maxsize=None)
+def _compile_lookup(keys: tuple[str | int, ...]) -> Callable[[Any], Any]:
+    """Compiles a path into chained subscriptions like ``root["contents"][0]``, four keys per call"""
+    for key in keys:
+        if type(key) not in (str, int):
+            raise TypeError(f"Invalid navigation key {key!r}, only str and int are supported")
+    parts = [_subscript(keys[i : i + 4]) for i in range(0, len(keys), 4)]
+    if not parts:
+        return lambda root: root
+    if len(parts) == 1:
+        return parts[0]
+    if len(parts) == 2:
+        first, second = parts
+        return lambda root: second(first(root))
+
+    def lookup(root: Any) -> Any:
+        for part in parts:
+            root = part(root)
+        return root
+
+    return lookup
+
+
+class NavPath(tuple[str | int, ...]):
+    """
+    Compiled navigation path for :py:func:`nav`.
+
+    Behaves like a tuple of keys, so it can be unpacked into other paths.
+    The lookup is compiled once on creation, so paths should be module level constants.
+    Concatenation with ``+`` accepts any sequence of keys and returns another NavPath.
+    """
+
+    _lookup: Callable[[Any], Any]
+
+    def __new__(cls, *keys: str | int) -> "NavPath":
+        path = super().__new__(cls, keys)
+        path._lookup = _compile_lookup(keys)
+        return path
+
+    def __add__(self, other: Sequence[Any]) -> "NavPath":  # type: ignore[override]
+        return NavPath(*self, *other)
+
+    def __radd__(self, other: Sequence[Any]) -> "NavPath":
+        return NavPath(*other, *self)
+
+CONTENT = NavPath("contents", 0)
+RUN_TEXT = NavPath("runs", 0, "text")
+TAB_CONTENT = NavPath("tabs", 0, "tabRenderer", "content")
+TAB_1_CONTENT = NavPath("tabs", 1, "tabRenderer", "content")
+TAB_2_CONTENT = NavPath("tabs", 2, "tabRenderer", "content")
+TWO_COLUMN_RENDERER = NavPath("contents", "twoColumnBrowseResultsRenderer")
+SINGLE_COLUMN = NavPath("contents", "singleColumnBrowseResultsRenderer")
+SINGLE_COLUMN_TAB = NavPath(*SINGLE_COLUMN, *TAB_CONTENT)
+SECTION = NavPath("sectionListRenderer")
+SECTION_LIST = NavPath(*SECTION, "contents")
+SECTION_LIST_ITEM = NavPath(*SECTION, *CONTENT)
+RESPONSIVE_HEADER = NavPath("musicResponsiveHeaderRenderer")
+ITEM_SECTION = NavPath("itemSectionRenderer", *CONTENT)
+MUSIC_SHELF = NavPath("musicShelfRenderer")
+GRID = NavPath("gridRenderer")
+GRID_ITEMS = NavPath(*GRID, "items")
+MENU = NavPath("menu", "menuRenderer")
+MENU_ITEMS = NavPath(*MENU, "items")
+MENU_LIKE_STATUS = NavPath(*MENU, "topLevelButtons", 0, "likeButtonRenderer", "likeStatus")
+MENU_SERVICE = NavPath("menuServiceItemRenderer", "serviceEndpoint")
 TOGGLE_MENU = "toggleMenuServiceItemRenderer"
-OVERLAY_RENDERER = ["musicItemThumbnailOverlayRenderer", "content", "musicPlayButtonRenderer"]
-PLAY_BUTTON = ["overlay", *OVERLAY_RENDERER]
-NAVIGATION_BROWSE = ["navigationEndpoint", "browseEndpoint"]
-NAVIGATION_BROWSE_ID = [*NAVIGATION_BROWSE, "browseId"]
-PAGE_TYPE = ["browseEndpointContextSupportedConfigs", "browseEndpointContextMusicConfig", "pageType"]
-WATCH_VIDEO_ID = ["watchEndpoint", "videoId"]
-PLAYLIST_ID = ["playlistId"]
-WATCH_PLAYLIST_ID = ["watchEndpoint", *PLAYLIST_ID]
-NAVIGATION_VIDEO_ID = ["navigationEndpoint", *WATCH_VIDEO_ID]
-QUEUE_VIDEO_ID = ["queueAddEndpoint", "queueTarget", "videoId"]
-NAVIGATION_PLAYLIST_ID = ["navigationEndpoint", *WATCH_PLAYLIST_ID]
-WATCH_PID = ["watchPlaylistEndpoint", *PLAYLIST_ID]
-NAVIGATION_WATCH_PLAYLIST_ID = ["navigationEndpoint", *WATCH_PID]
-NAVIGATION_VIDEO_TYPE = [
+OVERLAY_RENDERER = NavPath("musicItemThumbnailOverlayRenderer", "content", "musicPlayButtonRenderer")
+PLAY_BUTTON = NavPath("overlay", *OVERLAY_RENDERER)
+NAVIGATION_BROWSE = NavPath("navigationEndpoint", "browseEndpoint")
+NAVIGATION_BROWSE_ID = NavPath(*NAVIGATION_BROWSE, "browseId")
+PAGE_TYPE = NavPath("browseEndpointContextSupportedConfigs", "browseEndpointContextMusicConfig", "pageType")
+WATCH_VIDEO_ID = NavPath("watchEndpoint", "videoId")
+PLAYLIST_ID = NavPath("playlistId")
+WATCH_PLAYLIST_ID = NavPath("watchEndpoint", *PLAYLIST_ID)
+NAVIGATION_VIDEO_ID = NavPath("navigationEndpoint", *WATCH_VIDEO_ID)
+QUEUE_VIDEO_ID = NavPath("queueAddEndpoint", "queueTarget", "videoId")
+NAVIGATION_PLAYLIST_ID = NavPath("navigationEndpoint", *WATCH_PLAYLIST_ID)
+WATCH_PID = NavPath("watchPlaylistEndpoint", *PLAYLIST_ID)
+NAVIGATION_WATCH_PLAYLIST_ID = NavPath("navigationEndpoint", *WATCH_PID)
+NAVIGATION_VIDEO_TYPE = NavPath(
     "watchEndpoint",
     "watchEndpointMusicSupportedConfigs",
     "watchEndpointMusicConfig",
     "musicVideoType",
-]
-ICON_TYPE = ["icon", "iconType"]
-TOGGLED_BUTTON = ["toggleButtonRenderer", "isToggled"]
-TITLE = ["title", "runs", 0]
-TITLE_TEXT = ["title", *RUN_TEXT]
-TEXT_RUNS = ["text", "runs"]
-TEXT_RUN = [*TEXT_RUNS, 0]
-TEXT_RUN_TEXT = [*TEXT_RUN, "text"]
-SUBTITLE = ["subtitle", *RUN_TEXT]
-SUBTITLE_RUNS = ["subtitle", "runs"]
-SUBTITLE_RUN = [*SUBTITLE_RUNS, 0]
-SUBTITLE2 = [*SUBTITLE_RUNS, 2, "text"]
-SUBTITLE3 = [*SUBTITLE_RUNS, 4, "text"]
-THUMBNAIL = ["thumbnail", "thumbnails"]
-THUMBNAILS = ["thumbnail", "musicThumbnailRenderer", *THUMBNAIL]
-THUMBNAIL_RENDERER = ["thumbnailRenderer", "musicThumbnailRenderer", *THUMBNAIL]
-THUMBNAIL_OVERLAY_NAVIGATION = ["thumbnailOverlay", *OVERLAY_RENDERER, "playNavigationEndpoint"]
-THUMBNAIL_OVERLAY = [*THUMBNAIL_OVERLAY_NAVIGATION, *WATCH_PID]
-THUMBNAIL_CROPPED = ["thumbnail", "croppedSquareThumbnailRenderer", *THUMBNAIL]
-FEEDBACK_TOKEN = ["feedbackEndpoint", "feedbackToken"]
-BADGE_PATH = [0, "musicInlineBadgeRenderer", "accessibilityData", "accessibilityData", "label"]
-BADGE_LABEL = ["badges", *BADGE_PATH]
-SUBTITLE_BADGE_LABEL = ["subtitleBadges", *BADGE_PATH]
-CATEGORY_TITLE = ["musicNavigationButtonRenderer", "buttonText", *RUN_TEXT]
-CATEGORY_PARAMS = ["musicNavigationButtonRenderer", "clickCommand", "browseEndpoint", "params"]
+)
+ICON_TYPE = NavPath("icon", "iconType")
+TOGGLED_BUTTON = NavPath("toggleButtonRenderer", "isToggled")
+TITLE = NavPath("title", "runs", 0)
+TITLE_TEXT = NavPath("title", *RUN_TEXT)
+TEXT_RUNS = NavPath("text", "runs")
+TEXT_RUN = NavPath(*TEXT_RUNS, 0)
+TEXT_RUN_TEXT = NavPath(*TEXT_RUN, "text")
+SUBTITLE = NavPath("subtitle", *RUN_TEXT)
+SUBTITLE_RUNS = NavPath("subtitle", "runs")
+SUBTITLE_RUN = NavPath(*SUBTITLE_RUNS, 0)
+SUBTITLE2 = NavPath(*SUBTITLE_RUNS, 2, "text")
+SUBTITLE3 = NavPath(*SUBTITLE_RUNS, 4, "text")
+THUMBNAIL = NavPath("thumbnail", "thumbnails")
+THUMBNAILS = NavPath("thumbnail", "musicThumbnailRenderer", *THUMBNAIL)
+THUMBNAIL_RENDERER = NavPath("thumbnailRenderer", "musicThumbnailRenderer", *THUMBNAIL)
+THUMBNAIL_OVERLAY_NAVIGATION = NavPath("thumbnailOverlay", *OVERLAY_RENDERER, "playNavigationEndpoint")
+THUMBNAIL_OVERLAY = NavPath(*THUMBNAIL_OVERLAY_NAVIGATION, *WATCH_PID)
+THUMBNAIL_CROPPED = NavPath("thumbnail", "croppedSquareThumbnailRenderer", *THUMBNAIL)
+FEEDBACK_TOKEN = NavPath("feedbackEndpoint", "feedbackToken")
+BADGE_PATH = NavPath(0, "musicInlineBadgeRenderer", "accessibilityData", "accessibilityData", "label")
+BADGE_LABEL = NavPath("badges", *BADGE_PATH)
+SUBTITLE_BADGE_LABEL = NavPath("subtitleBadges", *BADGE_PATH)
+CATEGORY_TITLE = NavPath("musicNavigationButtonRenderer", "buttonText", *RUN_TEXT)
+CATEGORY_PARAMS = NavPath("musicNavigationButtonRenderer", "clickCommand", "browseEndpoint", "params")
 MMRIR = "musicMultiRowListItemRenderer"
 MRLIR = "musicResponsiveListItemRenderer"
 MTRIR = "musicTwoRowItemRenderer"
 MNIR = "menuNavigationItemRenderer"
-TASTE_PROFILE_ITEMS = ["contents", "tastebuilderRenderer", "contents"]
-TASTE_PROFILE_ARTIST = ["title", "runs"]
-SECTION_LIST_CONTINUATION = ["continuationContents", "sectionListContinuation"]
-MENU_PLAYLIST_ID = [*MENU_ITEMS, 0, MNIR, *NAVIGATION_WATCH_PLAYLIST_ID]
-MULTI_SELECT = ["musicMultiSelectMenuItemRenderer"]
-HEADER = ["header"]
-HEADER_DETAIL = [*HEADER, "musicDetailHeaderRenderer"]
-EDITABLE_PLAYLIST_DETAIL_HEADER = ["musicEditablePlaylistDetailHeaderRenderer"]
-HEADER_EDITABLE_DETAIL = [*HEADER, *EDITABLE_PLAYLIST_DETAIL_HEADER]
-HEADER_SIDE = [*HEADER, "musicSideAlignedItemRenderer"]
-HEADER_MUSIC_VISUAL = [*HEADER, "musicVisualHeaderRenderer"]
-DESCRIPTION_SHELF = ["musicDescriptionShelfRenderer"]
-DESCRIPTION = ["description", *RUN_TEXT]
-CAROUSEL = ["musicCarouselShelfRenderer"]
-IMMERSIVE_CAROUSEL = ["musicImmersiveCarouselShelfRenderer"]
-CAROUSEL_CONTENTS = [*CAROUSEL, "contents"]
-CAROUSEL_TITLE = [*HEADER, "musicCarouselShelfBasicHeaderRenderer", *TITLE]
-CARD_SHELF_TITLE = [*HEADER, "musicCardShelfHeaderBasicRenderer", *TITLE_TEXT]
-FRAMEWORK_MUTATIONS = ["frameworkUpdates", "entityBatchUpdate", "mutations"]
-TIMESTAMPED_LYRICS = [
+TASTE_PROFILE_ITEMS = NavPath("contents", "tastebuilderRenderer", "contents")
+TASTE_PROFILE_ARTIST = NavPath("title", "runs")
+SECTION_LIST_CONTINUATION = NavPath("continuationContents", "sectionListContinuation")
+MENU_PLAYLIST_ID = NavPath(*MENU_ITEMS, 0, MNIR, *NAVIGATION_WATCH_PLAYLIST_ID)
+MULTI_SELECT = NavPath("musicMultiSelectMenuItemRenderer")
+HEADER = NavPath("header")
+HEADER_DETAIL = NavPath(*HEADER, "musicDetailHeaderRenderer")
+EDITABLE_PLAYLIST_DETAIL_HEADER = NavPath("musicEditablePlaylistDetailHeaderRenderer")
+HEADER_EDITABLE_DETAIL = NavPath(*HEADER, *EDITABLE_PLAYLIST_DETAIL_HEADER)
+HEADER_SIDE = NavPath(*HEADER, "musicSideAlignedItemRenderer")
+HEADER_MUSIC_VISUAL = NavPath(*HEADER, "musicVisualHeaderRenderer")
+DESCRIPTION_SHELF = NavPath("musicDescriptionShelfRenderer")
+DESCRIPTION = NavPath("description", *RUN_TEXT)
+CAROUSEL = NavPath("musicCarouselShelfRenderer")
+IMMERSIVE_CAROUSEL = NavPath("musicImmersiveCarouselShelfRenderer")
+CAROUSEL_CONTENTS = NavPath(*CAROUSEL, "contents")
+CAROUSEL_TITLE = NavPath(*HEADER, "musicCarouselShelfBasicHeaderRenderer", *TITLE)
+CARD_SHELF_TITLE = NavPath(*HEADER, "musicCardShelfHeaderBasicRenderer", *TITLE_TEXT)
+FRAMEWORK_MUTATIONS = NavPath("frameworkUpdates", "entityBatchUpdate", "mutations")
+TIMESTAMPED_LYRICS = NavPath(
     "contents",
     "elementRenderer",
     "newElement",
@@ -100,31 +163,61 @@ TIMESTAMPED_LYRICS = [
     "model",
     "timedLyricsModel",
     "lyricsData",
-]
+)
+# combined paths used per item by the parsers, precompiled instead of concatenated on every call
+TITLE_RUNS = NavPath("title", "runs")
+TITLE_BROWSE_ID = NavPath(*TITLE, *NAVIGATION_BROWSE_ID)
+TITLE_PAGE_TYPE = NavPath(*TITLE, *NAVIGATION_BROWSE, *PAGE_TYPE)
+NAVIGATION_PAGE_TYPE = NavPath(*NAVIGATION_BROWSE, *PAGE_TYPE)
+BROWSE_PAGE_TYPE = NavPath("browseEndpoint", *PAGE_TYPE)
+TEXT_RUN_NAVIGATION = NavPath(*TEXT_RUN, "navigationEndpoint")
+TEXT_RUN_VIDEO_ID = NavPath(*TEXT_RUN, *NAVIGATION_VIDEO_ID)
+TEXT_RUN_BROWSE_ID = NavPath(*TEXT_RUN, *NAVIGATION_BROWSE_ID)
+PLAY_NAVIGATION = NavPath(*PLAY_BUTTON, "playNavigationEndpoint")
+PLAY_NAVIGATION_VIDEO_TYPE = NavPath(*PLAY_NAVIGATION, *NAVIGATION_VIDEO_TYPE)
+PLAY_NAVIGATION_PLAYLIST_ID = NavPath(*PLAY_NAVIGATION, *WATCH_PLAYLIST_ID)
+ON_TAP_VIDEO_ID = NavPath("onTap", *WATCH_VIDEO_ID)
+ON_TAP_VIDEO_TYPE = NavPath("onTap", *NAVIGATION_VIDEO_TYPE)
+THUMBNAIL_OVERLAY_VIDEO_ID = NavPath(*THUMBNAIL_OVERLAY_NAVIGATION, *WATCH_VIDEO_ID)
+THUMBNAIL_OVERLAY_VIDEO_TYPE = NavPath(*THUMBNAIL_OVERLAY_NAVIGATION, *NAVIGATION_VIDEO_TYPE)
+NAVIGATION_ENDPOINT_VIDEO_TYPE = NavPath("navigationEndpoint", *NAVIGATION_VIDEO_TYPE)
+MENU_VIDEO_TYPE = NavPath(*MENU_ITEMS, 0, MNIR, *NAVIGATION_ENDPOINT_VIDEO_TYPE)
+MENU_QUEUE_VIDEO_ID = NavPath(*MENU_SERVICE, *QUEUE_VIDEO_ID)
 
 
 @overload
-def nav(root: JsonDict | None, items: list[Any], none_if_absent: Literal[False] = False) -> Any:
+def nav(root: JsonDict | None, items: Sequence[Any], none_if_absent: Literal[False] = False) -> Any:
     """overload for mypy only"""
 
 
 @overload
-def nav(root: JsonDict | None, items: list[Any], none_if_absent: Literal[True] = True) -> Any | None:
+def nav(root: JsonDict | None, items: Sequence[Any], none_if_absent: Literal[True] = True) -> Any | None:
     """overload for mypy only"""
 
 
-def nav(root: JsonDict | None, items: list[Any], none_if_absent: bool = False) -> Any | None:
+def nav(root: JsonDict | None, items: Sequence[Any], none_if_absent: bool = False) -> Any | None:
     """Access a nested object in root by item sequence."""
     if root is None:
         return None
     try:
+        if isinstance(items, NavPath):
+            return items._lookup(root)
+        value: Any = root
         for k in items:
-            root = root[k]
+            value = value[k]
+        return value
     except (KeyError, IndexError) as e:
         if none_if_absent:
             return None
-        raise type(e)(f"Unable to find '{k}' using path {items!r} on {root!r}, exception: {e}")
-    return root
+        # walk the path again to report where it failed, only needed on this slow path
+        value = root
+        for k in items:
+            try:
+                value = value[k]
+            except (KeyError, IndexError):
+                break
+        # reported as a list, like the paths were before they became NavPath tuples
+        raise type(e)(f"Unable to find '{k}' using path {list(items)!r} on {value!r}, exception: {e}")
 
 
 def find_object_by_key(
@@ -1,5 +1,6 @@
 import typing
 from collections.abc import Callable
+from contextvars import ContextVar
 from functools import wraps
 from gettext import GNUTranslations
 from typing import ParamSpec, TypeVar
@@ -31,9 +32,9 @@ def parse_menu_playlists(data: JsonDict, result: JsonDict) -> None:
         else:
             continue
 
-        watch_id = nav(item, ["navigationEndpoint", "watchPlaylistEndpoint", "playlistId"], True)
+        watch_id = nav(item, NAVIGATION_WATCH_PLAYLIST_ID, True)
         if not watch_id:
-            watch_id = nav(item, ["navigationEndpoint", "watchEndpoint", "playlistId"], True)
+            watch_id = nav(item, NAVIGATION_PLAYLIST_ID, True)
         if watch_id:
             result[watch_key] = watch_id
 
@@ -101,12 +102,28 @@ class SupportsLang(typing.Protocol):
     lang: GNUTranslations
 
 
+#: translations of the innermost running :py:func:`i18n` method, per thread and task
+_current_lang: ContextVar[GNUTranslations | None] = ContextVar("_current_lang", default=None)
+
+
+def _gettext(message: str) -> str:
+    lang = _current_lang.get()
+    return lang.gettext(message) if lang is not None else message
+
+
 def i18n(method: Callable[P, R]) -> Callable[P, R]:
+    # ``_`` resolves the language of the caller, so that instances of different languages
+    # can share the module from several threads
+    method.__globals__["_"] = _gettext
+
     @wraps(method)
     def _impl(*args: P.args, **kwargs: P.kwargs) -> R:
         self = args[0]
-        method.__globals__["_"] = self.lang.gettext  # type: ignore
-        return method(*args, **kwargs)
+        token = _current_lang.set(self.lang)  # type: ignore[attr-defined]
+        try:
+            return method(*args, **kwargs)
+        finally:
+            _current_lang.reset(token)
 
     return _impl
 
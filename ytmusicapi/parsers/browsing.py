@@ -27,7 +27,7 @@ def parse_mixed_content(
                 data = nav(result, [MTRIR], True)
                 content = None
                 if data:
-                    page_type = nav(data, TITLE + NAVIGATION_BROWSE + PAGE_TYPE, True)
+                    page_type = nav(data, TITLE_PAGE_TYPE, True)
                     if page_type is None:  # song or watch_playlist
                         if nav(data, NAVIGATION_WATCH_PLAYLIST_ID, True) is not None:
                             content = parse_watch_playlist(data)
@@ -66,8 +66,8 @@ def parse_album(result: JsonDict) -> JsonDict:
     album = {
         "title": nav(result, TITLE_TEXT),
         "type": nav(result, SUBTITLE),
-        "artists": [parse_id_name(x) for x in nav(result, ["subtitle", "runs"]) if "navigationEndpoint" in x],
-        "browseId": nav(result, TITLE + NAVIGATION_BROWSE_ID),
+        "artists": [parse_id_name(x) for x in nav(result, SUBTITLE_RUNS) if "navigationEndpoint" in x],
+        "browseId": nav(result, TITLE_BROWSE_ID),
         "audioPlaylistId": parse_album_playlistid_if_exists(nav(result, THUMBNAIL_OVERLAY_NAVIGATION, True)),
         "thumbnails": nav(result, THUMBNAIL_RENDERER),
         "isExplicit": nav(result, SUBTITLE_BADGE_LABEL, True) is not None,
@@ -83,7 +83,7 @@ def parse_single(result: JsonDict) -> JsonDict:
     return {
         "title": nav(result, TITLE_TEXT),
         "year": nav(result, SUBTITLE, True),
-        "browseId": nav(result, TITLE + NAVIGATION_BROWSE_ID),
+        "browseId": nav(result, TITLE_BROWSE_ID),
         "thumbnails": nav(result, THUMBNAIL_RENDERER),
     }
 
@@ -103,14 +103,14 @@ def parse_song_flat(data: JsonDict, with_playlist_id: bool = False) -> JsonDict:
     columns = [get_flex_column_item(data, i) for i in range(0, len(data["flexColumns"]))]
     song = {
         "title": nav(columns[0], TEXT_RUN_TEXT),
-        "videoId": nav(columns[0], TEXT_RUN + NAVIGATION_VIDEO_ID, True),
-        "videoType": nav(data, [*PLAY_BUTTON, "playNavigationEndpoint", *NAVIGATION_VIDEO_TYPE], True),
+        "videoId": nav(columns[0], TEXT_RUN_VIDEO_ID, True),
+        "videoType": nav(data, PLAY_NAVIGATION_VIDEO_TYPE, True),
         "thumbnails": nav(data, THUMBNAILS),
         "isExplicit": nav(data, BADGE_LABEL, True) is not None,
     }
 
     if with_playlist_id:
-        song["playlistId"] = nav(data, [*PLAY_BUTTON, "playNavigationEndpoint", *WATCH_PLAYLIST_ID])
+        song["playlistId"] = nav(data, PLAY_NAVIGATION_PLAYLIST_ID)
 
     runs = nav(columns[1], TEXT_RUNS)
     song.update(parse_song_runs(runs, skip_type_spec=True))
@@ -118,7 +118,7 @@ def parse_song_flat(data: JsonDict, with_playlist_id: bool = False) -> JsonDict:
     if len(columns) > 2 and columns[2] is not None and "navigationEndpoint" in nav(columns[2], TEXT_RUN):
         song["album"] = {
             "name": nav(columns[2], TEXT_RUN_TEXT),
-            "id": nav(columns[2], TEXT_RUN + NAVIGATION_BROWSE_ID),
+            "id": nav(columns[2], TEXT_RUN_BROWSE_ID),
         }
 
     return song
@@ -132,7 +132,7 @@ def parse_video(result: JsonDict) -> JsonDict:
         videoId = next(
             video_id
             for entry in nav(result, MENU_ITEMS)
-            if (video_id := nav(entry, MENU_SERVICE + QUEUE_VIDEO_ID, True))
+            if (video_id := nav(entry, MENU_QUEUE_VIDEO_ID, True))
         )
     return {
         "title": nav(result, TITLE_TEXT),
@@ -151,7 +151,7 @@ def parse_playlist(data: JsonDict) -> JsonDict:
             TITLE_TEXT,
             none_if_absent=True,  # rare but possible for playlist title to be missing
         ),
-        "playlistId": nav(data, TITLE + NAVIGATION_BROWSE_ID)[2:],
+        "playlistId": nav(data, TITLE_BROWSE_ID)[2:],
         "thumbnails": nav(data, THUMBNAIL_RENDERER),
     }
     subtitle = data["subtitle"]
@@ -170,7 +170,7 @@ def parse_related_artist(data: JsonDict) -> JsonDict:
         subscribers = subscribers.split(" ")[0]
     return {
         "title": nav(data, TITLE_TEXT),
-        "browseId": nav(data, TITLE + NAVIGATION_BROWSE_ID),
+        "browseId": nav(data, TITLE_BROWSE_ID),
         "subscribers": subscribers,
         "thumbnails": nav(data, THUMBNAIL_RENDERER),
     }
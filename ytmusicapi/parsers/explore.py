@@ -15,7 +15,7 @@ def parse_chart_song(data: JsonDict) -> JsonDict:
 
 
 def parse_trending_item(data: JsonDict) -> JsonDict:
-    video_type = nav(data, [*PLAY_BUTTON, "playNavigationEndpoint", *NAVIGATION_VIDEO_TYPE])
+    video_type = nav(data, PLAY_NAVIGATION_VIDEO_TYPE)
     if video_type == "MUSIC_VIDEO_TYPE_PODCAST_EPISODE":
         return parse_episode_flat(data)
 
@@ -25,7 +25,7 @@ def parse_trending_item(data: JsonDict) -> JsonDict:
 def parse_chart_playlist(data: JsonDict) -> JsonDict:
     return {
         "title": nav(data, TITLE_TEXT),
-        "playlistId": nav(data, TITLE + NAVIGATION_BROWSE_ID)[2:],
+        "playlistId": nav(data, TITLE_BROWSE_ID)[2:],
         "thumbnails": nav(data, THUMBNAIL_RENDERER),
     }
 
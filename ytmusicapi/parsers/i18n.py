@@ -1,5 +1,8 @@
+import gettext
+from functools import lru_cache
 from gettext import GNUTranslations
 from gettext import gettext as _
+from pathlib import Path
 
 from ytmusicapi.navigation import (
     CAROUSEL,
@@ -82,3 +85,23 @@ class Parser:
                 )
 
         return artist
+
+
+#: directory of the compiled translations
+LOCALE_DIR = Path(__file__).parent.parent.resolve() / "locales"
+
+
+@lru_cache(maxsize=None)
+def get_translation(language: str) -> GNUTranslations:
+    """
+    Translations of a language, loaded on first use and shared by all clients.
+
+    :param language: one of :py:data:`ytmusicapi.constants.SUPPORTED_LANGUAGES`
+    """
+    return gettext.translation("base", localedir=LOCALE_DIR, languages=[language])  # type: ignore[return-value]
+
+
+@lru_cache(maxsize=None)
+def get_parser(language: str) -> Parser:
+    """Parser of a language, shared by all clients since it holds no other state"""
+    return Parser(get_translation(language))
@@ -15,7 +15,7 @@ def parse_artists(results: JsonList, uploaded: bool = False) -> JsonList:
         artist = {}
         artist["browseId"] = nav(data, NAVIGATION_BROWSE_ID)
         artist["artist"] = get_item_text(data, 0)
-        page_type = nav(data, NAVIGATION_BROWSE + PAGE_TYPE, True)
+        page_type = nav(data, NAVIGATION_PAGE_TYPE, True)
         if page_type == "MUSIC_PAGE_TYPE_USER_CHANNEL":
             artist["type"] = "channel"
         elif page_type == "MUSIC_PAGE_TYPE_ARTIST":
@@ -54,7 +54,7 @@ def parse_albums(results: JsonList) -> JsonList:
     for result in results:
         data = result[MTRIR]
         album = {}
-        album["browseId"] = nav(data, TITLE + NAVIGATION_BROWSE_ID)
+        album["browseId"] = nav(data, TITLE_BROWSE_ID)
         album["playlistId"] = nav(data, MENU_PLAYLIST_ID, none_if_absent=True)
         album["title"] = nav(data, TITLE_TEXT)
         album["thumbnails"] = nav(data, THUMBNAIL_RENDERER)
@@ -1,12 +1,19 @@
 import re
+from collections.abc import Iterator
+from concurrent.futures import Executor
 
 from ytmusicapi.continuations import *
-from ytmusicapi.helpers import sum_total_duration
+from ytmusicapi.models.tracks import AlbumRef, ArtistRef, Thumbnail, Track
 from ytmusicapi.type_alias import JsonDict, JsonList, ParseFuncType, RequestFuncBodyType
 
 from ..helpers import to_int
 from .songs import *
 
+EDIT_SET_VIDEO_ID = NavPath("playlistEditEndpoint", "actions", 0, "setVideoId")
+EDIT_REMOVED_VIDEO_ID = NavPath("playlistEditEndpoint", "actions", 0, "removedVideoId")
+TEXT_SIMPLE_TEXT = NavPath("text", "simpleText")
+INDEX_TEXT = NavPath("index", *RUN_TEXT)
+
 
 def parse_playlist_header(response: JsonDict) -> JsonDict:
     playlist: JsonDict = {}
@@ -92,9 +99,8 @@ def parse_playlist_header_meta(header: JsonDict) -> JsonDict:
     return playlist_meta
 
 
-def parse_audio_playlist(
-    response: JsonDict, limit: int | None, request_func: RequestFuncBodyType
-) -> JsonDict:
+def parse_audio_playlist_header(response: JsonDict) -> tuple[JsonDict, JsonDict]:
+    """:return: the playlist without tracks and its musicPlaylistShelfRenderer"""
     playlist: JsonDict = {
         "owned": False,
         "privacy": "PUBLIC",
@@ -111,31 +117,46 @@ def parse_audio_playlist(
 
     playlist["id"] = nav(content_data, ["targetId"])
     playlist["trackCount"] = nav(content_data, ["collapsedItemCount"])
+    return playlist, content_data
 
-    playlist["tracks"] = []
-    if "contents" in content_data:
-        playlist["tracks"] = parse_playlist_items(content_data["contents"])
-
-        parse_func: ParseFuncType = lambda contents: parse_playlist_items(contents)
-        playlist["tracks"].extend(get_continuations_2025(content_data, limit, request_func, parse_func))
-
-    playlist["title"] = playlist["tracks"][0]["album"]["name"]
 
-    playlist["duration_seconds"] = sum_total_duration(playlist)
-    return playlist
+def iter_playlist_shelf(
+    content_data: JsonDict,
+    limit: int | None,
+    request_func: RequestFuncBodyType,
+    is_collaborative: bool = False,
+    prefetch: Executor | None = None,
+    as_models: bool = False,
+) -> Iterator[JsonList]:
+    """
+    Yields the tracks of a musicPlaylistShelfRenderer page by page,
+    starting with the ones contained in the response itself.
+    """
+    if "contents" not in content_data:
+        return
+
+    parse_func: ParseFuncType = lambda contents: parse_playlist_items(
+        contents, is_collaborative=is_collaborative, as_models=as_models
+    )
+    yield parse_func(content_data["contents"])
+    yield from iter_continuations_2025(content_data, limit, request_func, parse_func, prefetch)
 
 
 def parse_playlist_items(
     results: JsonList,
     is_album: bool = False,
     is_collaborative: bool = False,
+    as_models: bool = False,
 ) -> JsonList:
+    """
+    :param as_models: return :py:class:`ytmusicapi.models.Track` instances instead of dictionaries
+    """
     songs = []
     for result in results:
         if MRLIR not in result:
             continue
         data = result[MRLIR]
-        song = parse_playlist_item(data, is_album, is_collaborative)
+        song = parse_playlist_item(data, is_album, is_collaborative, as_models)
         if song:
             songs.append(song)
 
@@ -146,7 +167,8 @@ def parse_playlist_item(
     data: JsonDict,
     is_album: bool = False,
     is_collaborative: bool = False,
-) -> JsonDict | None:
+    as_model: bool = False,
+) -> JsonDict | Track | None:
     videoId = setVideoId = None
     like = None
 
@@ -156,10 +178,8 @@ def parse_playlist_item(
             if "menuServiceItemRenderer" in item:
                 menu_service = nav(item, MENU_SERVICE)
                 if "playlistEditEndpoint" in menu_service:
-                    setVideoId = nav(menu_service, ["playlistEditEndpoint", "actions", 0, "setVideoId"], True)
-                    videoId = nav(
-                        menu_service, ["playlistEditEndpoint", "actions", 0, "removedVideoId"], True
-                    )
+                    setVideoId = nav(menu_service, EDIT_SET_VIDEO_ID, True)
+                    videoId = nav(menu_service, EDIT_REMOVED_VIDEO_ID, True)
 
     song_menu_data = {"inLibrary": None, "pinnedToListenAgain": None} | parse_song_menu_data(data)
 
@@ -189,7 +209,7 @@ def parse_playlist_item(
 
     for index in range(len(data["flexColumns"])):
         flex_column_item = get_flex_column_item(data, index)
-        navigation_endpoint = nav(flex_column_item, [*TEXT_RUN, "navigationEndpoint"], True)
+        navigation_endpoint = nav(flex_column_item, TEXT_RUN_NAVIGATION, True)
 
         if not navigation_endpoint:
             run = nav(flex_column_item, TEXT_RUN, True)
@@ -205,15 +225,7 @@ def parse_playlist_item(
         if "watchEndpoint" in navigation_endpoint:
             title_index = index
         elif "browseEndpoint" in navigation_endpoint:
-            page_type = nav(
-                navigation_endpoint,
-                [
-                    "browseEndpoint",
-                    "browseEndpointContextSupportedConfigs",
-                    "browseEndpointContextMusicConfig",
-                    "pageType",
-                ],
-            )
+            page_type = nav(navigation_endpoint, BROWSE_PAGE_TYPE)
 
             # MUSIC_PAGE_TYPE_ARTIST for regular songs, MUSIC_PAGE_TYPE_UNKNOWN for uploads
             if page_type == "MUSIC_PAGE_TYPE_ARTIST" or page_type == "MUSIC_PAGE_TYPE_UNKNOWN":
@@ -247,7 +259,7 @@ def parse_playlist_item(
     duration = get_item_text(data, duration_index) if duration_index else None
     if "fixedColumns" in data:
         if "simpleText" in nav(get_fixed_column_item(data, 0), ["text"]):
-            duration = nav(get_fixed_column_item(data, 0), ["text", "simpleText"])
+            duration = nav(get_fixed_column_item(data, 0), TEXT_SIMPLE_TEXT)
         else:
             duration = nav(get_fixed_column_item(data, 0), TEXT_RUN_TEXT)
 
@@ -255,11 +267,31 @@ def parse_playlist_item(
 
     isExplicit = nav(data, BADGE_LABEL, True) is not None
 
-    videoType = nav(
-        data,
-        [*MENU_ITEMS, 0, MNIR, "navigationEndpoint", *NAVIGATION_VIDEO_TYPE],
-        True,
-    )
+    videoType = nav(data, MENU_VIDEO_TYPE, True)
+
+    trackNumber = None
+    if is_album:
+        trackNumber = int(nav(data, INDEX_TEXT)) if isAvailable else None
+
+    if as_model:
+        return Track(
+            videoId=videoId,
+            title=title,
+            artists=[ArtistRef(**artist) for artist in artists] if artists is not None else None,
+            album=AlbumRef(**album) if album is not None else None,
+            likeStatus=like,
+            thumbnails=[Thumbnail.from_raw(thumbnail) for thumbnail in thumbnails] if thumbnails is not None else None,
+            isAvailable=isAvailable,
+            isExplicit=isExplicit,
+            videoType=videoType,
+            views=views,
+            duration=duration or None,
+            duration_seconds=parse_duration(duration) if duration else None,
+            trackNumber=trackNumber,
+            isAlbumTrack=is_album,
+            setVideoId=setVideoId or None,
+            **song_menu_data,
+        )
 
     song = {
         "videoId": videoId,
@@ -276,7 +308,7 @@ def parse_playlist_item(
     }
 
     if is_album:
-        song["trackNumber"] = int(nav(data, ["index", "runs", 0, "text"])) if isAvailable else None
+        song["trackNumber"] = trackNumber
 
     if duration:
         song["duration"] = duration
@@ -5,8 +5,11 @@ from ytmusicapi.type_alias import JsonDict, JsonList
 
 from .songs import *
 
-PROGRESS_RENDERER = ["musicPlaybackProgressRenderer"]
-DURATION_TEXT = ["durationText", "runs", 1, "text"]
+PROGRESS_RENDERER = NavPath("musicPlaybackProgressRenderer")
+DURATION_TEXT = NavPath("durationText", "runs", 1, "text")
+PLAYBACK_DURATION_TEXT = NavPath("playbackProgress", *PROGRESS_RENDERER, *DURATION_TEXT)
+ON_TAP_INDEX = NavPath("onTap", "watchEndpoint", "index")
+PLAYLIST_ITEM_VIDEO_ID = NavPath("playlistItemData", "videoId")
 
 
 @dataclass
@@ -109,13 +112,13 @@ def parse_episode(data: JsonDict) -> JsonDict:
     """Parses a single episode under "Episodes" on a channel page or on a podcast page"""
     thumbnails = nav(data, THUMBNAILS)
     date = nav(data, SUBTITLE, True)
-    duration = nav(data, ["playbackProgress", *PROGRESS_RENDERER, *DURATION_TEXT], True)
+    duration = nav(data, PLAYBACK_DURATION_TEXT, True)
     title = nav(data, TITLE_TEXT)
     description = nav(data, DESCRIPTION, True)
-    videoId = nav(data, ["onTap", *WATCH_VIDEO_ID], True)
-    browseId = nav(data, [*TITLE, *NAVIGATION_BROWSE_ID], True)
-    videoType = nav(data, ["onTap", *NAVIGATION_VIDEO_TYPE], True)
-    index = nav(data, ["onTap", "watchEndpoint", "index"], True)
+    videoId = nav(data, ON_TAP_VIDEO_ID, True)
+    browseId = nav(data, TITLE_BROWSE_ID, True)
+    videoType = nav(data, ON_TAP_VIDEO_TYPE, True)
+    index = nav(data, ON_TAP_INDEX, True)
     return {
         "index": index,
         "title": title,
@@ -133,10 +136,10 @@ def parse_episode_flat(data: JsonDict) -> JsonDict:
     return {
         "title": nav(get_flex_column_item(data, 0), TEXT_RUN_TEXT),
         "podcast": parse_id_name(nav(get_flex_column_item(data, 1), TEXT_RUN)),
-        "videoId": nav(data, ["playlistItemData", "videoId"]),
-        "browseId": nav(get_flex_column_item(data, 0), [*TEXT_RUN, *NAVIGATION_BROWSE_ID]),
-        "playlistId": nav(data, [*PLAY_BUTTON, "playNavigationEndpoint", *WATCH_PLAYLIST_ID]),
-        "videoType": nav(data, [*PLAY_BUTTON, "playNavigationEndpoint", *NAVIGATION_VIDEO_TYPE]),
+        "videoId": nav(data, PLAYLIST_ITEM_VIDEO_ID),
+        "browseId": nav(get_flex_column_item(data, 0), TEXT_RUN_BROWSE_ID),
+        "playlistId": nav(data, PLAY_NAVIGATION_PLAYLIST_ID),
+        "videoType": nav(data, PLAY_NAVIGATION_VIDEO_TYPE),
         "date": nav(get_flex_column_item(data, 2), TEXT_RUN_TEXT),
         "thumbnails": nav(data, THUMBNAILS),
     }
@@ -146,8 +149,8 @@ def parse_podcast(data: JsonDict) -> JsonDict:
     """Parses a single podcast under "Podcasts" on a channel page"""
     return {
         "title": nav(data, TITLE_TEXT),
-        "channel": parse_id_name(nav(data, [*SUBTITLE_RUNS, 0], True)),
-        "browseId": nav(data, TITLE + NAVIGATION_BROWSE_ID),
+        "channel": parse_id_name(nav(data, SUBTITLE_RUN, True)),
+        "browseId": nav(data, TITLE_BROWSE_ID),
         "podcastId": nav(data, THUMBNAIL_OVERLAY, True),
         "thumbnails": nav(data, THUMBNAIL_RENDERER),
     }
@@ -6,6 +6,10 @@ from .albums import parse_album_playlistid_if_exists
 from .artists import parse_artists_runs
 from .songs import *
 
+BUTTON_COMMAND = NavPath("buttons", 0, "buttonRenderer", "command")
+PLAY_NAVIGATION_VIDEO_ID = NavPath(*PLAY_NAVIGATION, *WATCH_VIDEO_ID)
+LIVE_BADGE = NavPath("badges", 0, "liveBadgeRenderer")
+
 ALL_RESULT_TYPES = [
     "album",
     "artist",
@@ -43,7 +47,7 @@ def parse_top_result(data: JsonDict, search_result_types: list[str]) -> JsonDict
         if subscribers:
             search_result["subscribers"] = subscribers.split(" ")[0]
 
-        artist_info = parse_song_runs(nav(data, ["title", "runs"]))
+        artist_info = parse_song_runs(nav(data, TITLE_RUNS))
         search_result.update(artist_info)
 
     if result_type in ["song", "video"]:
@@ -53,28 +57,28 @@ def parse_top_result(data: JsonDict, search_result_types: list[str]) -> JsonDict
             search_result["videoType"] = nav(on_tap, NAVIGATION_VIDEO_TYPE)
 
     if result_type in ["song", "video", "album"]:
-        search_result["videoId"] = nav(data, ["onTap", *WATCH_VIDEO_ID], True)
-        search_result["videoType"] = nav(data, ["onTap", *NAVIGATION_VIDEO_TYPE], True)
+        search_result["videoId"] = nav(data, ON_TAP_VIDEO_ID, True)
+        search_result["videoType"] = nav(data, ON_TAP_VIDEO_TYPE, True)
 
         search_result["title"] = nav(data, TITLE_TEXT)
-        runs = nav(data, ["subtitle", "runs"])
+        runs = nav(data, SUBTITLE_RUNS)
         song_info = parse_song_runs(runs[2:])
         search_result.update(song_info)
 
     if result_type in ["album"]:
-        search_result["browseId"] = nav(data, TITLE + NAVIGATION_BROWSE_ID, True)
-        button_command = nav(data, ["buttons", 0, "buttonRenderer", "command"], True)
+        search_result["browseId"] = nav(data, TITLE_BROWSE_ID, True)
+        button_command = nav(data, BUTTON_COMMAND, True)
         search_result["playlistId"] = parse_album_playlistid_if_exists(button_command)
 
     if result_type in ["playlist"]:
         search_result["playlistId"] = nav(data, MENU_PLAYLIST_ID)
         search_result["title"] = nav(data, TITLE_TEXT)
-        search_result["author"] = parse_artists_runs(nav(data, ["subtitle", "runs"])[2:])
+        search_result["author"] = parse_artists_runs(nav(data, SUBTITLE_RUNS)[2:])
 
     if result_type in ["episode"]:
         search_result["title"] = nav(data, TITLE_TEXT)
-        search_result["videoId"] = nav(data, [*THUMBNAIL_OVERLAY_NAVIGATION, *WATCH_VIDEO_ID])
-        search_result["videoType"] = nav(data, [*THUMBNAIL_OVERLAY_NAVIGATION, *NAVIGATION_VIDEO_TYPE])
+        search_result["videoId"] = nav(data, THUMBNAIL_OVERLAY_VIDEO_ID)
+        search_result["videoType"] = nav(data, THUMBNAIL_OVERLAY_VIDEO_TYPE)
         runs = nav(data, SUBTITLE_RUNS)[2:]
         search_result["date"] = runs[0]["text"]
         search_result["podcast"] = parse_id_name(runs[2])
@@ -86,7 +90,7 @@ def parse_top_result(data: JsonDict, search_result_types: list[str]) -> JsonDict
 def parse_search_result(data: JsonDict, result_type: str | None, category: str | None) -> JsonDict:
     default_offset = (not result_type or result_type == "album") * 2
     search_result: JsonDict = {"category": category}
-    video_type = nav(data, [*PLAY_BUTTON, "playNavigationEndpoint", *NAVIGATION_VIDEO_TYPE], True)
+    video_type = nav(data, PLAY_NAVIGATION_VIDEO_TYPE, True)
 
     # determine result type based on browseId
     #  if there was no category title (i.e. for extra results in Top Result)
@@ -122,7 +126,7 @@ def parse_search_result(data: JsonDict, result_type: str | None, category: str |
 
     elif result_type == "album":
         search_result["type"] = get_item_text(data, 1)
-        play_navigation = nav(data, [*PLAY_BUTTON, "playNavigationEndpoint"], True)
+        play_navigation = nav(data, PLAY_NAVIGATION, True)
         search_result["playlistId"] = parse_album_playlistid_if_exists(play_navigation)
 
     elif result_type == "playlist":
@@ -149,7 +153,7 @@ def parse_search_result(data: JsonDict, result_type: str | None, category: str |
     elif result_type == "upload":
         browse_id = nav(data, NAVIGATION_BROWSE_ID, True)
         if not browse_id:  # song result
-            flex_items = [nav(get_flex_column_item(data, i), ["text", "runs"], True) for i in range(2)]
+            flex_items = [nav(get_flex_column_item(data, i), TEXT_RUNS, True) for i in range(2)]
             if flex_items[0]:
                 search_result["videoId"] = nav(flex_items[0][0], NAVIGATION_VIDEO_ID, True)
                 search_result["playlistId"] = nav(flex_items[0][0], NAVIGATION_PLAYLIST_ID, True)
@@ -175,9 +179,7 @@ def parse_search_result(data: JsonDict, result_type: str | None, category: str |
                 search_result["resultType"] = "album"
 
     if result_type in ["song", "video", "episode"]:
-        search_result["videoId"] = nav(
-            data, [*PLAY_BUTTON, "playNavigationEndpoint", "watchEndpoint", "videoId"], True
-        )
+        search_result["videoId"] = nav(data, PLAY_NAVIGATION_VIDEO_ID, True)
         search_result["videoType"] = video_type
 
     if result_type in ["song", "video", "album"]:
@@ -202,7 +204,7 @@ def parse_search_result(data: JsonDict, result_type: str | None, category: str |
         flex_item = get_flex_column_item(data, 1)
         runs = nav(flex_item, TEXT_RUNS)[default_offset:]
         has_date = int(len(runs) > 1)
-        search_result["live"] = bool(nav(data, ["badges", 0, "liveBadgeRenderer"], True))
+        search_result["live"] = bool(nav(data, LIVE_BADGE, True))
         if has_date:
             search_result["date"] = runs[0]["text"]
 
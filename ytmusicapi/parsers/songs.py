@@ -7,6 +7,8 @@ from ._utils import *
 from .artists import parse_artists_runs
 from .constants import DOT_SEPARATOR_RUN
 
+DEFAULT_ICON_TYPE = NavPath("defaultIcon", "iconType")
+
 
 def parse_song_artists(data: JsonDict, index: int) -> JsonList:
     flex_item = get_flex_column_item(data, index)
@@ -85,7 +87,7 @@ def parse_song_runs(runs: JsonList, skip_type_spec: bool = False) -> JsonDict:
 
 def parse_song_album(data: JsonDict, index: int) -> JsonDict | None:
     flex_item = get_flex_column_item(data, index)
-    browse_id = nav(flex_item, TEXT_RUN + NAVIGATION_BROWSE_ID, True)
+    browse_id = nav(flex_item, TEXT_RUN_BROWSE_ID, True)
     return None if not flex_item else {"name": get_item_text(data, index), "id": browse_id}
 
 
@@ -121,9 +123,7 @@ def parse_song_menu_data(data: JsonDict) -> JsonDict:
         song_data["inLibrary"] = song_data.get("inLibrary", False)
         song_data["pinnedToListenAgain"] = song_data.get("pinnedToListenAgain", False)
 
-        current_icon_type = nav(menu_item, ["defaultIcon", "iconType"], True) or nav(
-            menu_item, ["icon", "iconType"], True
-        )
+        current_icon_type = nav(menu_item, DEFAULT_ICON_TYPE, True) or nav(menu_item, ICON_TYPE, True)
         feedback_token: Callable[[str], str | None] = lambda endpoint_type: nav(
             menu_item, [endpoint_type, *FEEDBACK_TOKEN], True
         )
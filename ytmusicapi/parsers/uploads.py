@@ -3,6 +3,8 @@ from ytmusicapi.type_alias import JsonList
 from ._utils import *
 from .songs import parse_song_album, parse_song_artists
 
+FIRST_MENU_SERVICE = NavPath(*MENU_ITEMS, 0, *MENU_SERVICE)
+
 
 def parse_uploaded_items(results: JsonList) -> JsonList:
     songs = []
@@ -27,7 +29,7 @@ def parse_uploaded_items(results: JsonList) -> JsonList:
                 "entityId",
             ],
         )
-        videoId = nav(data, [*MENU_ITEMS, 0, *MENU_SERVICE])["queueAddEndpoint"]["queueTarget"]["videoId"]
+        videoId = nav(data, FIRST_MENU_SERVICE)["queueAddEndpoint"]["queueTarget"]["videoId"]
 
         title = get_item_text(data, 0)
         like = nav(data, MENU_LIKE_STATUS)
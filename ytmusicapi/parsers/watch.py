@@ -4,6 +4,8 @@ from ytmusicapi.type_alias import JsonDict, JsonList
 
 from .songs import *
 
+LENGTH_TEXT = NavPath("lengthText", *RUN_TEXT)
+
 
 def parse_watch_playlist(results: JsonList) -> JsonList:
     tracks = []
@@ -39,10 +41,10 @@ def parse_watch_track(data: JsonDict) -> JsonDict:
     track = {
         "videoId": data["videoId"],
         "title": nav(data, TITLE_TEXT),
-        "length": nav(data, ["lengthText", "runs", 0, "text"], True),
+        "length": nav(data, LENGTH_TEXT, True),
         "thumbnail": nav(data, THUMBNAIL),
         "likeStatus": like_status,
-        "videoType": nav(data, ["navigationEndpoint", *NAVIGATION_VIDEO_TYPE], True),
+        "videoType": nav(data, NAVIGATION_ENDPOINT_VIDEO_TYPE, True),
     }
 
     track.update(
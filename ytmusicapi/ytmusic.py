@@ -1,19 +1,21 @@
 from __future__ import annotations
 
-import gettext
+import hashlib
 import json
-import locale
 import time
-from collections.abc import Iterator
-from contextlib import contextmanager, suppress
+from collections.abc import Collection, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import cached_property, partial
-from pathlib import Path
-from typing import Any
+from gettext import GNUTranslations
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import requests
 from requests import Response
 from requests.structures import CaseInsensitiveDict
 
+from ytmusicapi import json_backend
+from ytmusicapi.cache import CachePolicy, ResponseCache, request_cache_key
 from ytmusicapi.helpers import (
     SUPPORTED_LANGUAGES,
     SUPPORTED_LOCATIONS,
@@ -35,15 +37,25 @@ from ytmusicapi.mixins.podcasts import PodcastsMixin
 from ytmusicapi.mixins.search import SearchMixin
 from ytmusicapi.mixins.uploads import UploadsMixin
 from ytmusicapi.mixins.watch import WatchMixin
-from ytmusicapi.parsers.i18n import Parser
+from ytmusicapi.parsers.i18n import Parser, get_parser, get_translation
+from ytmusicapi.singleflight import SingleFlight
 
-from .auth.auth_parse import determine_auth_type, parse_auth_str
-from .auth.oauth import OAuthCredentials, RefreshingToken
-from .auth.oauth.token import Token
 from .auth.types import AuthType
 from .exceptions import YTMusicServerError, YTMusicUserError
 from .type_alias import JsonDict
 
+if TYPE_CHECKING:
+    from .auth.oauth import OAuthCredentials
+    from .auth.oauth.token import Token
+
+
+class RawResponse(NamedTuple):
+    """undecoded response of a post request, immutable so it can be shared"""
+
+    status_code: int
+    reason: str
+    content: bytes
+
 
 class YTMusicBase:
     def __init__(
@@ -55,6 +67,9 @@ class YTMusicBase:
         language: str = "en",
         location: str = "",
         oauth_credentials: OAuthCredentials | None = None,
+        cache: ResponseCache | None = None,
+        cache_policy: CachePolicy | None = None,
+        max_inflight_continuations: int = 4,
     ):
         """
         Create a new instance to interact with YouTube Music.
@@ -89,19 +104,44 @@ class YTMusicBase:
             Available languages can be checked in the FAQ.
         :param oauth_credentials: Optional. Used to specify a different oauth client to be
             used for authentication flow.
+        :param cache: Optional. A :py:class:`ytmusicapi.cache.ResponseCache` for responses of
+            read-only requests, which may be shared between instances. Default: no caching.
+        :param cache_policy: Optional. Decides which requests are cached for how long.
+            Default: :py:class:`ytmusicapi.cache.CachePolicy` with the default time to live per endpoint.
+        :param max_inflight_continuations: Optional. Maximum number of continuation pages requested
+            in the background while the previous page is parsed, shared by all calls of this instance.
+            Every call requests at most one page ahead. 0 to request every page when it is needed. Default: 4
         """
-        #: request session for connection pooling
-        self._session = self._prepare_session(requests_session)
+        self._requests_session = requests_session
         self.proxies: dict[str, str] | None = proxies  #: params for session modification
         # see google cookie docs: https://policies.google.com/technologies/cookies
         # value from https://github.com/yt-dlp/yt-dlp/blob/master/yt_dlp/extractor/youtube.py#L502
         self.cookies = {"SOCS": "CAI"}
 
+        self.cache = cache
+        self.cache_policy = cache_policy or CachePolicy()
+        #: coalesces identical concurrent read-only requests
+        self._inflight: SingleFlight[RawResponse] = SingleFlight()
+        #: runs the prefetch requests of paginated calls
+        self._continuation_executor = (
+            ThreadPoolExecutor(max_inflight_continuations, thread_name_prefix="ytmusicapi-continuations")
+            if max_inflight_continuations > 0
+            else None
+        )
+
         self._auth_headers: CaseInsensitiveDict[str] = CaseInsensitiveDict[str]()
         self.auth_type = AuthType.UNAUTHORIZED
+        #: digest of the credentials, separates cache entries of different accounts
+        self._auth_identity = ""
         if auth is not None:
+            # the auth flows and their dependencies are only loaded if needed
+            from .auth.auth_parse import determine_auth_type, parse_auth_str
+
             self._auth_headers, auth_path = parse_auth_str(auth)
             self.auth_type = determine_auth_type(self._auth_headers)
+            self._auth_identity = hashlib.sha256(
+                json.dumps(sorted((k.lower(), str(v)) for k, v in self._auth_headers.items())).encode("utf-8")
+            ).hexdigest()
 
             self._token: Token
             if self.auth_type == AuthType.OAUTH_CUSTOM_CLIENT:
@@ -110,6 +150,8 @@ class YTMusicBase:
                         "oauth JSON provided via auth argument, but oauth_credentials not provided."
                         "Please provide oauth_credentials as specified in the OAuth setup documentation."
                     )
+                from .auth.oauth import RefreshingToken
+
                 #: OAuth credential handler
                 self._token = RefreshingToken(
                     credentials=oauth_credentials,
@@ -131,15 +173,6 @@ class YTMusicBase:
             )
         self.context["context"]["client"]["hl"] = language
         self.language = language
-        try:
-            locale.setlocale(locale.LC_ALL, self.language)
-        except locale.Error:
-            with suppress(locale.Error):
-                locale.setlocale(locale.LC_ALL, "en_US.UTF-8")
-
-        locale_dir = Path(__file__).parent.resolve() / "locales"
-        self.lang = gettext.translation("base", localedir=locale_dir, languages=[language])
-        self.parser = Parser(self.lang)
 
         if user:
             self.context["context"]["user"]["onBehalfOfUser"] = user
@@ -155,6 +188,15 @@ class YTMusicBase:
             except KeyError:
                 raise YTMusicUserError("Your cookie is missing the required value __Secure-3PAPISID")
 
+    @cached_property
+    def lang(self) -> GNUTranslations:
+        """translations of :py:attr:`language`, loaded on first use and shared with other instances"""
+        return get_translation(self.language)
+
+    @cached_property
+    def parser(self) -> Parser:
+        return get_parser(self.language)
+
     @cached_property
     def base_headers(self) -> CaseInsensitiveDict[str]:
         headers = (
@@ -218,30 +260,73 @@ class YTMusicBase:
             # safely restore the old context
             self.context["context"]["client"] = copied_context_client
 
+    @cached_property
+    def _session(self) -> requests.Session:
+        """request session for connection pooling, created on first use"""
+        return self._prepare_session(self._requests_session)
+
     def _prepare_session(self, requests_session: requests.Session | None) -> requests.Session:
         """Prepare requests session or use user-provided requests_session"""
         if isinstance(requests_session, requests.Session):
             return requests_session
-        self._session = requests.Session()
-        self._session.request = partial(self._session.request, timeout=30)  # type: ignore[method-assign]
-        return self._session
+        session = requests.Session()
+        session.request = partial(session.request, timeout=30)  # type: ignore[method-assign]
+        return session
 
-    def _send_request(self, endpoint: str, body: JsonDict, additionalParams: str = "") -> JsonDict:
+    def _send_request(
+        self, endpoint: str, body: JsonDict, additionalParams: str = "", fields: Collection[str] | None = None
+    ) -> JsonDict:
+        """
+        :param fields: Optional. Dotted paths of the subtrees the caller reads, e.g. ``("contents", "header")``.
+            All other parts of the response are dropped right after decoding and are not cached,
+            so that cache hits decode only the selected parts. Default: the whole response
+        """
         body.update(self.context)
 
+        cache_key, ttl = "", None
+        if self.cache is not None:
+            ttl = self.cache_policy.ttl(endpoint, body, self.auth_type != AuthType.UNAUTHORIZED)
+            if ttl:
+                cache_key = request_cache_key(endpoint, body, additionalParams, self._auth_identity, fields)
+                if (cached := self._cache_get(self.cache, cache_key)) is not None:
+                    return json_backend.loads(cached)
+
+        coalesce_key = None
+        if self.cache_policy.read_only(endpoint):
+            # the raw response is shared regardless of the fields each caller selects from it
+            coalesce_key = request_cache_key(endpoint, body, additionalParams, self._auth_identity)
+        response = self._post_request(YTM_BASE_API + endpoint + self.params + additionalParams, body, coalesce_key)
+        response_text: JsonDict = json_backend.loads(response.content)
+        if response.status_code >= 400:
+            message = "Server returned HTTP " + str(response.status_code) + ": " + response.reason + ".\n"
+            error = response_text.get("error", {}).get("message")
+            raise YTMusicServerError(message + error)
+        if fields is not None:
+            response_text = json_backend.select_fields(response_text, fields)
+        if self.cache is not None and ttl:
+            self.cache.set(
+                cache_key, response.content if fields is None else json_backend.dumps(response_text), ttl
+            )
+        return response_text
+
+    def _cache_get(self, cache: ResponseCache, key: str) -> bytes | None:
+        return cache.get(key)
+
+    def _post_request(self, url: str, body: JsonDict, coalesce_key: str | None = None) -> RawResponse:
+        """
+        :param coalesce_key: Optional. Concurrent requests with the same key share a single round trip.
+        """
+        if coalesce_key is not None:
+            return self._inflight.do(coalesce_key, partial(self._post_request, url, body))
+
         response = self._session.post(
-            YTM_BASE_API + endpoint + self.params + additionalParams,
+            url,
             json=body,
             headers=self.headers,
             proxies=self.proxies,
             cookies=self.cookies,
         )
-        response_text: JsonDict = json.loads(response.text)
-        if response.status_code >= 400:
-            message = "Server returned HTTP " + str(response.status_code) + ": " + response.reason + ".\n"
-            error = response_text.get("error", {}).get("message")
-            raise YTMusicServerError(message + error)
-        return response_text
+        return RawResponse(response.status_code, response.reason, response.content)
 
     def _send_get_request(
         self, url: str, params: JsonDict | None = None, use_base_headers: bool = False
@@ -275,7 +360,9 @@ class YTMusicBase:
         exc_value: BaseException | None,
         traceback: Any | None,
     ) -> bool | None:
-        pass
+        if self._continuation_executor is not None:
+            self._continuation_executor.shutdown(wait=False, cancel_futures=True)
+        return None
 
 
 class YTMusic(